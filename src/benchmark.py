@@ -0,0 +1,169 @@
+import os
+import sys
+import tracemalloc
+from timeit import Timer
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [root, os.path.join(root, "src")]
+
+
+def best(statement, number=100000, repeat=5, **context) -> float:
+    return min(Timer(statement, globals=context).repeat(repeat, number)) / number
+
+
+def allocated(foo) -> (object, int):
+    tracemalloc.start()
+    try:
+        result = foo()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def utterance(length: int) -> str:
+    np = "(NP (NP (PRP$ my) (NN avatar) (NN url)) (PP (IN of) (NP (NN saloed))))"
+    nps = " (, ,) ".join([np] * length)
+    return "(ROOT (S (VP (VB show) (NP {}))))".format(nps)
+
+
+def trees(lengths=(10, 100, 1000)) -> list:
+    from nltk import Tree
+    from src.main.nlp.StanfordParser import StanfordParser
+    results = []
+    for length in lengths:
+        nltk_tree, nltk_bytes = allocated(lambda: Tree.fromstring(utterance(length))[0])
+        tree, tree_bytes = allocated(lambda: StanfordParser.convert(nltk_tree))
+        number = max(1, 1000 // length)
+        results.extend([
+            ("{} NPs, nltk.Tree bytes".format(length), nltk_bytes),
+            ("{} NPs, tree bytes".format(length), tree_bytes),
+            ("{} NPs, convert us".format(length), best("convert(tree)", number, convert=StanfordParser.convert,
+                                                       tree=nltk_tree) * 1e6),
+            ("{} NPs, flatten us".format(length), best("tree.flatten()", number, tree=tree) * 1e6),
+            ("{} NPs, sub_children us".format(length), best("tree.sub_children(labels=['VP', 'NP'])", number, tree=tree) * 1e6)
+        ])
+    return results
+
+
+def allocations(runs=100) -> list:
+    from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+    from src.main.types.Node import LeafNounPhrase
+    from src.main.types.Object import Object, Login, Null
+    builder = EvaluationBuilder(lambda: None, lambda _type: None)
+    builder._execute = lambda foo, args: Null(None)
+    phrases = [("repo", [], [Object.valueOf("gitbot"), Login("hackermadcat")]), ("url", ["my", "avatar"], []),
+               ("login", [], [Object.valueOf("hackermadcat")]), ("repos", ["starred"], [Object.valueOf("saloed")]),
+               ("id", [], [Object.valueOf("12"), Object.valueOf("gitbot")])]
+    init = Object.__init__
+    created = [0]
+
+    def counting(self, *args, **kwargs):
+        created[0] += 1
+        init(self, *args, **kwargs)
+
+    Object.__init__ = counting
+    tracemalloc.start()
+    try:
+        results = []
+        for noun, adjectives, arguments in phrases:
+            created[0] = 0
+            peak = float("inf")
+            for _ in range(runs):
+                tracemalloc.reset_peak()
+                start = tracemalloc.get_traced_memory()[0]
+                builder._build(LeafNounPhrase(noun, adjectives), arguments)
+                peak = min(peak, tracemalloc.get_traced_memory()[1] - start)
+            name = " ".join(adjectives + [noun])
+            results.extend([("{} Objects".format(name), created[0] / runs), ("{} peak bytes".format(name), peak)])
+        return results
+    finally:
+        tracemalloc.stop()
+        Object.__init__ = init
+
+
+def dispatch(scale=50) -> list:
+    from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+    from src.main.types.Shell import Shell
+    builder = EvaluationBuilder(lambda: None, lambda _type: None)
+    builder._builders = {noun: shells + [Shell(shell.adjectives + ["x{}".format(k)], shell.functions)
+                                         for k in range(1, scale) for shell in shells]
+                         for noun, shells in builder._builders.items()}
+    if hasattr(EvaluationBuilder, "_compile"): builder._index = EvaluationBuilder._compile(builder._builders)
+    queries = [("url", ["my", "avatar"]), ("url", ["my", "avatar", "big"]), ("repos", []), ("repo", ["first"])]
+    return [("{}x table, {} {} us".format(scale, noun, adjectives),
+             best("shell(noun, adjectives)", 10000, shell=builder._get_relevant_shell, noun=noun,
+                  adjectives=adjectives) * 1e6) for noun, adjectives in queries]
+
+
+def memory(count=10000) -> list:
+    from github import Github
+    from github.Repository import Repository
+    from src.main.types import Object, Types
+    requester = Github()._Github__requester
+    repos = [Repository(requester, {}, {"id": i, "name": "repo{}".format(i), "owner": {"login": "saloed"},
+                                        "url": "https://api.github.com/repos/saloed/repo{}".format(i)}, completed=True)
+             for i in range(count)]
+    objects, held = allocated(lambda: [Object.Repo(repo) for repo in repos])
+    _list = Object.List(repos, Types.List(Types.Repo()))
+    tracemalloc.start()
+    try:
+        str(_list)
+        _list.simplify()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return [("{} Repo Objects, held KB".format(count), held / 1024),
+            ("render and simplify {} repos, peak KB".format(count), peak / 1024)]
+
+
+def registry(extra=(0, 100)) -> list:
+    from src.main.types import Object, Types
+    results = []
+    registered = 0
+    for count in extra:
+        for i in range(registered, count):
+            type("Extra{}".format(i), (Types.Type,), {"__slots__": ()})
+            type("Extra{}".format(i), (Object.Object,), {"__slots__": (), "__str__": lambda self: ""})
+        registered = count
+        words = "show my avatar url and repos of saloed".split()
+        results.extend([
+            ("+{} classes, valueOf(list repo) us".format(count),
+             best("valueOf(['list', 'repo'])", 20000, valueOf=Types.Type.valueOf) * 1e6),
+            ("+{} classes, type('abc') us".format(count), best("type('abc')", 20000, type=Types.Type.type) * 1e6),
+            ("+{} classes, Object.create(login) us".format(count),
+             best("create(login, 'saloed')", 20000, create=Object.Object.create, login=Types.Login()) * 1e6),
+            ("+{} classes, extract us".format(count), best("extract(words)", 20000, extract=Types.Type.extract,
+                                                            words=words) * 1e6)
+        ])
+    return results
+
+
+def type_compare() -> list:
+    from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+    from src.main.types import Types
+    from src.main.types.Object import Object, Login
+    first, second = Types.List(Types.Repo()), Types.Type.valueOf(["list", "repo"])
+    chains = [EvaluationBuilder.Chain(Object.valueOf("gitbot")), EvaluationBuilder.Chain(Login("hackermadcat"))]
+    holes = [Types.Login(), Types.String()]
+    return [
+        ("List eq us", best("first == second", first=first, second=second) * 1e6),
+        ("List hash us", best("hash(first)", first=first) * 1e6),
+        ("List(Repo()) us", best("List(repo)", List=Types.List, repo=Types.Repo()) * 1e6),
+        ("two-hole _get_arguments us", best("get(chains, list(holes))", number=10000,
+                                            get=EvaluationBuilder._get_arguments, chains=chains, holes=holes) * 1e6)
+    ]
+
+
+benchmarks = {
+    "allocations": allocations,
+    "dispatch": dispatch,
+    "memory": memory,
+    "registry": registry,
+    "trees": trees,
+    "types": type_compare
+}
+
+if __name__ == "__main__":
+    for name in sys.argv[1:] or sorted(benchmarks):
+        for label, value in benchmarks[name]():
+            print("{:>10}  {:<40} {:>14.3f}".format(name, label, value))
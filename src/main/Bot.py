@@ -1,12 +1,16 @@
-from github import GithubException
+from threading import Thread
 
 from main.interfaces.Stream import Stream
 from src.main.interfaces.Handler import Handler
 from src.main.interfaces.Executor import Executor
 from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.nlp.FastParser import FastParser
+from src.main.nlp.ParseCache import ParseCache
 from src.main.nlp.StanfordCorrector import StanfordCorrector
 from src.main.nlp.StanfordParser import StanfordParser
+from src.main.nlp.StanfordServer import StanfordServer
 from src.main.types import Types
+from src.main.types.Node import Root
 from src.main.types.Object import Object
 from src.main.Connector import Connector, NotAutorisedUserException
 from src.main import Simplifier
@@ -17,23 +21,27 @@ from src import IO
 
 class Bot(Handler, Executor):
 
-    def __init__(self, bot_nick="Bot", default_nick="User", max_nick_len=20):
+    def __init__(self, bot_nick="Bot", default_nick="User", max_nick_len=20, parser_server=False, cache_path=None,
+                 warm_up=True):
         super().__init__()
         self._bot_nick = bot_nick
         self._nick = default_nick
         self._default_nick = default_nick
         self._max_nick_len = max_nick_len
         self._connect = False
+        self._warm_up = warm_up
         self._connector = Connector()
         self._storeds = Tables.create_storeds_map()
         self._functions = Tables.create_functions_map(lambda: self)
-        self._parser = StanfordParser()
-        self._corrector = StanfordCorrector()
+        self._server = StanfordServer() if parser_server else None
+        self._parser = StanfordParser(self._server)
+        self._corrector = StanfordCorrector(self._server)
+        self._cache = ParseCache(path=cache_path)
         self._builder = EvaluationBuilder(lambda: self._connector, lambda _type: self._storeds[_type])
+        self._fast_parser = FastParser(self._builder.nouns)
         self._stream = Stream()
         self._stream.add(self._read)
-        self._stream.add(self._parser.parse)
-        self._stream.add(self._corrector.correct)
+        self._stream.add(self._analyse)
         self._stream.add(self._builder.build)
         self._stream.add(self.execute)
 
@@ -45,6 +53,17 @@ class Bot(Handler, Executor):
     def _read(self) -> str:
         return IO.readln(Utils.format_nick(self._nick, self._max_nick_len) + "  ::  ")
 
+    def _analyse(self, string: str) -> Root:
+        root = self._fast_parser.parse(string)
+        if root is not None: return root
+        root = self._cache.get(string)
+        if root is None:
+            parsed = self._parser.parse(string)
+            IO.debug(parsed)
+            root = None if parsed is None else self._corrector.correct(parsed)
+            self._cache.put(string, root)
+        return root
+
     def _hide_read(self) -> str:
         return IO.readln(Utils.format_nick("password", self._max_nick_len) + "  ::  ")
         # return IO.hreadln(self.format_nick(self._nick, self._max_nick_len) + "  ::  ")  # not work in pycharm console
@@ -52,12 +71,25 @@ class Bot(Handler, Executor):
     def _custom_read(self, prompt: str):
         return IO.readln(Utils.format_nick(prompt, self._max_nick_len) + "  ::  ")
 
+    def _prime(self):
+        try:
+            self._parser.warm_up()
+            self._corrector.warm_up()
+        except Exception as ex:
+            IO.debug("warm up failed: {}", ex)
+
     def _start(self):
+        if self._warm_up and self._server is not None: Thread(target=self._prime, daemon=True).start()
         self._print("hello")
 
-    def _stop(self): pass
+    def _stop(self):
+        if self._server is not None: self._server.stop()
+        self._builder.close()
+        self._parser.close()
+        self._cache.close()
 
     def handle(self):
+        from github import GithubException
         try:
             self._stream.run()
         except NotAutorisedUserException as _:
@@ -79,8 +111,8 @@ class Bot(Handler, Executor):
             word = Simplifier.simplify_word(str(obj.object))
             if word in self._functions: self._functions[word](obj)
         else:
-            string = str(obj)
-            if not (string + ' ').isspace(): self._print(string)
+            for line in obj.lines():
+                if not (line + ' ').isspace(): self._print(line)
 
     def store(self, obj: Object):
         if obj.type == Types.String() and obj.object == "me":
@@ -1,8 +1,15 @@
-from github import Github
-from github.Gist import Gist
-from github.GithubException import BadCredentialsException
-from github.NamedUser import NamedUser
-from github.Repository import Repository
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from threading import Lock, local
+from typing import TYPE_CHECKING
+
+from src import IO
+from src.main.types.Pages import Pages
+
+if TYPE_CHECKING:
+    import github.Gist
+    import github.NamedUser
+    import github.Repository
 
 
 class NotAutorisedUserException(Exception):
@@ -10,43 +17,111 @@ class NotAutorisedUserException(Exception):
 
 
 class Connector:
+    class Plan:
+        def __init__(self):
+            from concurrent.futures import Future
+            self._future = Future
+            self._requests = OrderedDict()
+            self._mentions = Counter()
+            self._lock = Lock()
+            self.statistics = Counter()
+
+        def fetch(self, key: tuple, foo):
+            with self._lock:
+                future = self._requests.get(key)
+                owner = future is None
+                if owner:
+                    future = self._future()
+                    self._requests[key] = future
+                self._mentions[key] += 1
+                self.statistics["requests" if owner else "saved"] += 1
+            if owner:
+                try:
+                    future.set_result(foo())
+                except Exception as ex:
+                    future.set_exception(ex)
+            return future.result()
+
+        def __str__(self):
+            return '\n'.join("{}({}) x{}".format(name, key, self._mentions[(name, key)])
+                              for name, key in self._requests.keys())
+
+    @property
+    def _git(self):
+        if getattr(self._local, "generation", None) != self._generation:
+            from github import Github
+            self._local.git = Github(*self._credentials, per_page=Pages.per_page)
+            self._local.generation = self._generation
+        return self._local.git
+
     def __init__(self):
-        self._git = Github()
+        self._local = local()
+        self._credentials = ()
+        self._generation = 0
         self._authorised = None
+        self._plan = None
+
+    @contextmanager
+    def plan(self):
+        self._plan = Connector.Plan()
+        try:
+            yield self._plan
+        finally:
+            plan, self._plan = self._plan, None
+            IO.debug("plan:\n{}", plan)
+            IO.debug("requests = {}, saved = {}", plan.statistics["requests"], plan.statistics["saved"])
+
+    def _fetch(self, key: tuple, foo):
+        plan = self._plan
+        return foo() if plan is None else plan.fetch(key, foo)
+
+    def _connect(self, *credentials):
+        self._credentials = credentials
+        self._generation += 1
 
     def isauthorised(self, login: str, pword: str) -> bool:
-        self._git = Github(login, pword)
+        from github.GithubException import BadCredentialsException
+        self._connect(login, pword)
         try:
             self._authorised = self._git.get_user().login
         except BadCredentialsException:
-            self._git = Github()
+            self._connect()
             return False
         else:
             return True
 
     def logout(self):
         self._authorised = None
-        self._git = Github()
+        self._connect()
 
     def authorised(self) -> str:
         return self._authorised
 
-    def user(self, login=None) -> NamedUser:
+    def _user(self, login):
+        user = self._git.get_user() if login is None else self._git.get_user(login)
+        user.login
+        return user
+
+    def user(self, login=None) -> 'github.NamedUser.NamedUser':
         if self._authorised and (not login or login.lower() == self._authorised.lower()):
-            user = self._git.get_user()
+            return self._fetch(("user", self._authorised.lower()), lambda: self._user(None))
         elif login:
-            user = self._git.get_user(login)
+            return self._fetch(("user", login.lower()), lambda: self._user(login))
         else:
             raise NotAutorisedUserException()
-        user.login
-        return user
 
-    def repo(self, id) -> Repository:
+    def _repo(self, id):
         repo = self._git.get_repo(id)
         repo.owner
         return repo
 
-    def gist(self, id) -> Gist:
+    def repo(self, id) -> 'github.Repository.Repository':
+        return self._fetch(("repo", str(id).lower()), lambda: self._repo(id))
+
+    def _gist(self, id):
         gist = self._git.get_gist(id)
         gist.owner
         return gist
+
+    def gist(self, id) -> 'github.Gist.Gist':
+        return self._fetch(("gist", str(id)), lambda: self._gist(id))
@@ -2,6 +2,8 @@ from abc import ABCMeta, abstractmethod
 
 
 class Node(metaclass=ABCMeta):
+    __slots__ = ("_label", "_children")
+
     @property
     def label(self) -> str:
         return self._label
@@ -9,6 +11,9 @@ class Node(metaclass=ABCMeta):
     @abstractmethod
     def flatten(self) -> list: pass
 
+    @abstractmethod
+    def leaves(self) -> list: pass
+
     def __init__(self, label: str):
         self._label = label
         self._children = []
@@ -1,5 +1,6 @@
-from copy import deepcopy
-from github import GithubException
+from collections import Counter
+from itertools import combinations
+from threading import Lock
 
 from src.main.interfaces.Builder import Builder, Closure
 from src.main.types import Types
@@ -23,9 +24,50 @@ class EvaluationBuilder(Builder):
             super().__init__(str(think))
             self._think = think
 
-    def __init__(self, get_connector, get_stored):
+    class Chain:
+        def __init__(self, argument: Object):
+            self._values = [argument]
+
+        def __getitem__(self, level: int) -> Object:
+            while len(self._values) <= level:
+                self._values.append(self._values[-1].simplify())
+            return self._values[level]
+
+        def __str__(self):
+            return str(self._values[-1])
+
+        def __repr__(self):
+            return self.__str__()
+
+    @property
+    def nouns(self) -> set:
+        return set(self._builders.keys())
+
+    def __init__(self, get_connector, get_stored, prune=True, workers=4):
+        self._get_connector = get_connector
         self._builders = Tables.create_builders_map(get_connector, get_stored)
         self._type_builders = Tables.create_type_builders_mpa(get_connector)
+        self._index = EvaluationBuilder._compile(self._builders)
+        self._prune = prune
+        self._workers = workers
+        self._pool = None
+        self._lock = Lock()
+        self.statistics = Counter()
+
+    def _map(self, foo, nodes: list) -> list:
+        leaves = [node for node in nodes if isinstance(node, LeafNounPhrase)]
+        if len(leaves) < 2 or self._workers < 2:
+            return [foo(node) for node in nodes]
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=self._workers)
+        futures = {id(node): self._pool.submit(foo, node) for node in leaves}
+        built = [None if id(node) in futures else foo(node) for node in nodes]
+        return [futures[id(node)].result() if id(node) in futures else result for node, result in zip(nodes, built)]
+
+    def close(self):
+        if self._pool is not None: self._pool.shutdown()
+        self._pool = None
 
     def _build(self, node: NounPhrase, args: list) -> list:
         if isinstance(node, LeafNounPhrase):
@@ -42,25 +84,30 @@ class EvaluationBuilder(Builder):
             shell = self._get_relevant_shell(noun, adjectives)
             if shell is not None:
                 adjectives = shell.difference(adjectives)
-                function = self._get_relevant_function(noun, adjectives, shell.functions, args)
+                function = self._get_relevant_function(noun, adjectives, shell, args)
                 if function.mass < float("inf"): constructed_object = self._execute(function, function.relevant_args)
             if constructed_object is None: constructed_object = Object.valueOf(string)
             IO.debug("relevant_function = {}", function)
             IO.debug("===========================")
             return [constructed_object]
         else:
-            _args = [arg.mark(pp.pretext) for pp in node.pps for np in pp.nps for arg in self._build(np, [])]
-            return [arg for np in node.nps for arg in self._build(np, args + _args)]
+            pretexts = [pp.pretext for pp in node.pps for _ in pp.nps]
+            built = self._map(lambda np: self._build(np, []), [np for pp in node.pps for np in pp.nps])
+            _args = [arg.mark(pretext) for pretext, objects in zip(pretexts, built) for arg in objects]
+            return [arg for objects in self._map(lambda np: self._build(np, args + _args), node.nps) for arg in objects]
 
     def build(self, root: Root) -> list:
         closures = []
+        with self._get_connector().plan():
+            built = iter(self._map(lambda node: self._build(node, []), [node for vp in root.vps for node in vp.nps]))
         for vp in root.vps:
-            args = [self._build(node, []) for node in vp.nps] if len(vp.nps) > 0 else [Null()]
+            args = [next(built) for _ in vp.nps] if len(vp.nps) > 0 else [Null()]
             closures.extend([Closure(Simplifier.simplify_word(vb.text), arg) for arg in args for vb in vp.vbs])
         return closures
 
     @staticmethod
     def _execute(foo: Function, args: list):
+        from github import GithubException
         try:
             data = foo.run(*[arg.object for arg in args])
             if data is None: raise EvaluationBuilder.NotFoundException(foo.result)
@@ -69,73 +116,92 @@ class EvaluationBuilder(Builder):
         else:
             return Object.create(foo.result, data)
 
-    def _get_relevant_shells(self, noun: str, adjectives: list) -> list:
-        relevant_shells = []
-        set_adjectives = set(adjectives)
-        if noun in self._builders:
-            shells = self._builders[noun]
-            for shell in shells:
-                set_shell_adjectives = set(shell.adjectives)
-                conjunction = set_shell_adjectives & set_adjectives
-                if len(conjunction) == len(set_shell_adjectives): relevant_shells.append(shell)
-        return relevant_shells
+    @staticmethod
+    def _compile(builders: dict) -> dict:
+        index = {}
+        for noun, shells in builders.items():
+            ordered = sorted(shells, key=lambda _shell: -len(_shell.adjectives))
+            exact = {}
+            for rank, shell in enumerate(ordered): exact.setdefault(shell.adjective_set, (rank, shell))
+            index[noun] = (exact, ordered)
+        return index
 
     def _get_relevant_shell(self, noun: str, adjectives: list) -> Shell:
-        relevant_shells = self._get_relevant_shells(noun, adjectives)
-        if len(relevant_shells) == 0: return None
-        min_shell = relevant_shells[0]
-        min_dist = min_shell.distance(adjectives)
-        for i, shell in enumerate(relevant_shells):
-            if i == 0: continue
-            distance = shell.distance(adjectives)
-            if distance < min_dist:
-                min_dist = distance
-                min_shell = shell
-        return min_shell
+        if noun not in self._index: return None
+        exact, ordered = self._index[noun]
+        set_adjectives = frozenset(adjectives)
+        if set_adjectives in exact: return exact[set_adjectives][1]
+        if 2 ** len(set_adjectives) < len(ordered):
+            for size in reversed(range(len(set_adjectives))):
+                subsets = (frozenset(subset) for subset in combinations(set_adjectives, size))
+                found = [exact[subset] for subset in subsets if subset in exact]
+                if len(found) > 0: return min(found, key=lambda pair: pair[0])[1]
+            return None
+        for shell in ordered:
+            if shell.adjective_set <= set_adjectives: return shell
+        return None
 
     @staticmethod
-    def _get_arguments(arguments: list, holes: list):
-        arguments = list(deepcopy(arguments))
+    def _reachable(hole: Types.Type, arguments: list) -> bool:
+        return any(isinstance(argument.type, Types.List) or hole in Object.path(argument.type) for argument in arguments)
+
+    @staticmethod
+    def _get_arguments(chains: list, holes: list):
+        chains = list(chains)
         relevant_arguments = []
         mass = 0
-        primitives = False
-        idle = False
+        level = 0
         fine = 1
-        while not (idle and primitives) and len(holes) > 0 and len(arguments) > 0:
-            primitives = True
+        while len(holes) > 0 and len(chains) > 0:
+            arguments = [chain[level] for chain in chains]
             idle = True
             for i, argument in enumerate(arguments):
-                if not argument.type.isprimitive(): primitives = False
                 if argument.type == holes[0]:
                     del holes[0]
-                    del arguments[i]
+                    del chains[i]
                     relevant_arguments.append(argument)
                     mass += (i + 1) * fine
                     idle = False
                     break
-            if idle:
-                arguments = [argument.simplify() for argument in arguments]
-                fine += 4
+            primitives = idle and all(argument.type.isprimitive() for argument in arguments)
             IO.debug("primitives = {}", primitives)
             IO.debug("idle = {}", idle)
             IO.debug("holes = {}", holes)
-            IO.debug("arguments = {}", arguments)
+            IO.debug("arguments = {}", chains)
             IO.debug("---------------------------")
+            if primitives or idle and not EvaluationBuilder._reachable(holes[0], arguments): break
+            if idle:
+                level += 1
+                fine += 4
         return relevant_arguments, mass
 
-    def _get_relevant_function(self, noun: str, adjectives: list, functions: list, arguments: list) -> WFunction:
+    def _bound(self, noun: str, function: Function) -> tuple:
+        cost = function.cost
+        if noun in self._type_builders and len(function.args) == 1: cost = min(cost, self._type_builders[noun].cost)
+        return -len(function.args), -len(function.args), cost
+
+    def _get_relevant_function(self, noun: str, adjectives: list, shell: Shell, arguments: list) -> WFunction:
         relevant_function = NullFunction()
-        for function in functions:
-            holes = list(deepcopy(function.args))
+        best = relevant_function.score + (float("inf"),)
+        evaluated = pruned = 0
+        adjective_arguments = [Object.valueOf(jj) for jj in reversed(adjectives)]
+        chains = [EvaluationBuilder.Chain(argument) for argument in arguments]
+        adjective_chains = [EvaluationBuilder.Chain(argument) for argument in adjective_arguments]
+        for index, function in shell.candidates(len(arguments) + len(adjectives)):
+            if self._prune and self._bound(noun, function) + (index,) > best:
+                pruned += 1
+                continue
+            evaluated += 1
+            holes = list(function.args)
             IO.debug(holes)
             IO.debug(arguments)
             IO.debug(adjectives)
-            IO.debug(list(reversed([Object.valueOf(jj) for jj in adjectives])))
-            relevant_arguments, mass = self._get_arguments(arguments, holes)
+            IO.debug(adjective_arguments)
+            relevant_arguments, mass = self._get_arguments(chains, holes)
             if noun in self._type_builders and len(holes) == 1 and len(function.args) == 1:
                 temp_function = self._type_builders[noun]
                 if holes == list(temp_function.args): function = temp_function
-            pair = self._get_arguments(list(reversed([Object.valueOf(jj) for jj in adjectives])), holes)
+            pair = self._get_arguments(adjective_chains, holes)
             relevant_arguments.extend(pair[0])
             mass += pair[1] - 2 * len(function.args)
             IO.debug("function = {}", function)
@@ -143,6 +209,13 @@ class EvaluationBuilder(Builder):
             IO.debug("relevant_function = {}", relevant_function)
             IO.debug("mass = {}", mass if len(holes) == 0 else float("inf"))
             IO.debug("+++++++++++++++++++++++++++")
-            if len(holes) == 0 and relevant_function.mass > mass:
+            if len(holes) == 0 and (mass, -len(relevant_arguments), function.cost, index) < best:
                 relevant_function = WFunction(mass, relevant_arguments, function)
+                best = relevant_function.score + (index,)
+        if best[-1] < float("inf"): shell.win(best[-1])
+        with self._lock:
+            self.statistics["evaluated"] += evaluated
+            self.statistics["pruned"] += pruned
+        IO.debug("candidates evaluated = {}, pruned = {}, total evaluated = {}, total pruned = {}", evaluated, pruned,
+                 self.statistics["evaluated"], self.statistics["pruned"])
         return relevant_function
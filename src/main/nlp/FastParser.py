@@ -0,0 +1,55 @@
+import re
+from collections import Counter
+from time import perf_counter
+
+from src import IO
+from src.main import Simplifier
+from src.main.types.Node import LeafNounPhrase, NounPhrase, PrepositionalPhrase, Root, VerbPhrase
+
+
+class FastParser:
+    commands = {"hello", "bye"}
+
+    toggles = {"log": {"in", "out"}}
+
+    determiners = {"my", "this"}
+
+    possessive = re.compile(r"^([\w.-]+)'s$")
+
+    def __init__(self, nouns: set):
+        self._nouns = nouns
+        self.statistics = Counter()
+
+    def _noun(self, word: str) -> bool:
+        return Simplifier.simplify_word(word) in self._nouns
+
+    def _match(self, words: list) -> Root:
+        simple = [Simplifier.simplify_word(word) for word in words]
+        if len(words) == 1 and simple[0] in FastParser.commands:
+            return Root(vps=[VerbPhrase(nps=[LeafNounPhrase(words[0])], vbs=["show"])])
+        if len(words) == 2 and simple[1] in FastParser.toggles.get(simple[0], set()):
+            return Root(vps=[VerbPhrase(nps=[LeafNounPhrase(words[1])], vbs=[words[0]])])
+        verb = "show"
+        if len(words) > 1 and simple[0] == "show":
+            verb = words[0]
+            words = words[1:]
+            simple = simple[1:]
+        if len(words) == 1 and self._noun(words[0]):
+            return Root(vps=[VerbPhrase(nps=[LeafNounPhrase(words[0])], vbs=[verb])])
+        if len(words) != 2 or not self._noun(words[1]): return None
+        if simple[0] in FastParser.determiners:
+            return Root(vps=[VerbPhrase(nps=[LeafNounPhrase(words[1], [words[0]])], vbs=[verb])])
+        owner = FastParser.possessive.match(words[0])
+        if owner is not None and owner.group(1).lower() not in FastParser.determiners:
+            pp = PrepositionalPhrase("'s", [LeafNounPhrase(owner.group(1))])
+            return Root(vps=[VerbPhrase(nps=[NounPhrase([LeafNounPhrase(words[1])], [pp])], vbs=[verb])])
+        return None
+
+    def parse(self, string: str) -> Root:
+        start = perf_counter()
+        root = self._match(string.split())
+        self.statistics["hits" if root is not None else "misses"] += 1
+        self.statistics["time"] += perf_counter() - start
+        IO.debug("fast path hits = {}, misses = {}, average = {}ms", self.statistics["hits"], self.statistics["misses"],
+                 round(1000 * self.statistics["time"] / (self.statistics["hits"] + self.statistics["misses"]), 3))
+        return root
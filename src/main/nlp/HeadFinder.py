@@ -0,0 +1,21 @@
+class HeadFinder:
+    left = "left"
+    right = "right"
+
+    rules = [
+        (right, {"NN", "NNP", "NNPS", "NNS", "NX", "POS", "JJR"}),
+        (left, {"NP"}),
+        (right, {"$", "ADJP", "PRN"}),
+        (right, {"CD"}),
+        (right, {"JJ", "JJS", "RB", "QP"})
+    ]
+
+    @staticmethod
+    def head(labels: list) -> int:
+        if len(labels) == 0: raise Exception("Empty constituent has no head")
+        if labels[-1] == "POS": return len(labels) - 1
+        for direction, candidates in HeadFinder.rules:
+            indexes = range(len(labels)) if direction == HeadFinder.left else reversed(range(len(labels)))
+            for i in indexes:
+                if labels[i] in candidates: return i
+        return len(labels) - 1
@@ -0,0 +1,83 @@
+import shelve
+from collections import Counter, OrderedDict
+
+from src import IO
+from src.main import nlp
+from src.main.types.Node import Root
+
+
+class ParseCache:
+    _model_key = "__model_path__"
+    _stamp_key = "__stamp__"
+    _format_key = "__format__"
+    _format = 3
+    _prefix = "u:"
+
+    def __init__(self, size=256, path=None, disk_size=4096):
+        self._size = size
+        self._disk_size = disk_size
+        self._memory = OrderedDict()
+        self._disk = None if path is None else shelve.open(path)
+        self._model_path = None
+        self.statistics = Counter()
+        self._validate()
+
+    @staticmethod
+    def normalize(string: str) -> str:
+        return ' '.join(string.split())
+
+    def _validate(self):
+        if self._model_path == nlp.model_path: return
+        if self._model_path is not None: self.statistics["invalidations"] += 1
+        self._model_path = nlp.model_path
+        self._memory.clear()
+        if self._disk is not None and (self._disk.get(ParseCache._model_key) != self._model_path or
+                                       self._disk.get(ParseCache._format_key) != ParseCache._format):
+            self._disk.clear()
+            self._disk[ParseCache._model_key] = self._model_path
+            self._disk[ParseCache._format_key] = ParseCache._format
+            self._disk[ParseCache._stamp_key] = 0
+
+    def _remember(self, key: str, root: Root):
+        self._memory[key] = root
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._size:
+            self._memory.popitem(last=False)
+            self.statistics["evictions"] += 1
+
+    def _store(self, key: str, root: Root):
+        stamp = self._disk[ParseCache._stamp_key] + 1
+        self._disk[ParseCache._stamp_key] = stamp
+        self._disk[ParseCache._prefix + key] = (stamp, root)
+        if len(self._disk) - 3 <= self._disk_size: return
+        stamps = sorted((self._disk[k][0], k) for k in self._disk.keys() if k.startswith(ParseCache._prefix))
+        for _, k in stamps[:len(stamps) - self._disk_size * 3 // 4]:
+            del self._disk[k]
+            self.statistics["disk evictions"] += 1
+
+    def get(self, string: str) -> Root:
+        self._validate()
+        key = ParseCache.normalize(string)
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.statistics["hits"] += 1
+            return self._memory[key]
+        if self._disk is not None and ParseCache._prefix + key in self._disk:
+            root = self._disk[ParseCache._prefix + key][1]
+            self._remember(key, root)
+            self.statistics["disk hits"] += 1
+            return root
+        self.statistics["misses"] += 1
+        return None
+
+    def put(self, string: str, root: Root):
+        self._validate()
+        key = ParseCache.normalize(string)
+        if len(key) == 0 or root is None: return
+        self._remember(key, root)
+        if self._disk is not None: self._store(key, root)
+        IO.debug("cache = {}", dict(self.statistics))
+
+    def close(self):
+        if self._disk is not None: self._disk.close()
+        self._disk = None
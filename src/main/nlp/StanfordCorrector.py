@@ -1,14 +1,24 @@
-from copy import deepcopy
-
-from nltk.parse.stanford import StanfordDependencyParser
+from collections import Counter
+from itertools import product
+from threading import Lock
+from typing import TYPE_CHECKING
 
+from src import IO
 from src.main.interfaces.Corrector import Corrector
 from src.main.types.Node import Adjective, LeafNounPhrase, Noun, NounPhrase, PrepositionalPhrase, Root, Verb, VerbPhrase
 from src.main.nlp.StanfordParser import Node
+from src.main.nlp.StanfordServer import StanfordServer
+from src.main.nlp.HeadFinder import HeadFinder
+from src.main import nlp
+
+if TYPE_CHECKING:
+    import nltk.parse.stanford
 
 
 class StanfordCorrector(Corrector):
-    parser = StanfordDependencyParser(model_path="edu/stanford/nlp/models/lexparser/englishPCFG.ser.gz")
+    _subprocess = None
+
+    _lock = Lock()
 
     phrase_level = {
         "ADJP", "ADVP", "CONJR", "FRAG", "INTJ", "LST", "NAC", "NP", "NX", "PP", "PRN", "PRT", "QP", "RRC", "UCP", "VP",
@@ -30,54 +40,111 @@ class StanfordCorrector(Corrector):
     fixable_sentence = {"NP", "FRAG", "UCP", "PP", "ADJP", "INTJ"}
 
     @staticmethod
-    def collocation(collocation: list) -> LeafNounPhrase:
-        if len(collocation) == 0: raise Exception()
-        if len(collocation) == 1: return LeafNounPhrase(collocation[0])
-        np = LeafNounPhrase()
-        for i, node in next(StanfordCorrector.parser.raw_parse(" ".join(collocation))).nodes.items():
-            if node["word"] is None: continue
-            if node["head"] == 0:
-                np.nn = Noun(node["word"])
-            else:
-                np.jjs.append(Adjective(node["word"]))
-        return np
+    def subprocess() -> 'nltk.parse.stanford.StanfordDependencyParser':
+        with StanfordCorrector._lock:
+            if StanfordCorrector._subprocess is None:
+                from nltk.parse.stanford import StanfordDependencyParser
+                nlp.configure()
+                StanfordCorrector._subprocess = StanfordDependencyParser(model_path=nlp.model_path)
+        return StanfordCorrector._subprocess
+
+    def __init__(self, server: StanfordServer = None, batch=True, heads=True, limit=64):
+        self._server = server
+        self._parser = None
+        self._batch = batch
+        self._heads = heads
+        self._limit = limit
+        self._collocations = []
+        self.statistics = Counter()
+
+    def _backend(self):
+        if self._parser is None:
+            self._parser = StanfordCorrector.subprocess() if self._server is None else self._server.dependency_parser()
+        return self._parser
+
+    def warm_up(self, string="avatar url"):
+        if not self._heads: self._raw_parse_sents([string])
+
+    def _raw_parse_sents(self, strings: list) -> list:
+        try:
+            return [next(graphs) for graphs in self._backend().raw_parse_sents(strings)]
+        except StanfordServer.DeadServerException as ex:
+            IO.debug("parser server {} is dead, fall back to subprocess parser", ex)
+            self._parser = StanfordCorrector.subprocess()
+            return [next(graphs) for graphs in self._parser.raw_parse_sents(strings)]
+
+    def collocation(self, leaves: list, jjss=None) -> list:
+        if len(leaves) == 0: raise Exception()
+        if jjss is None: jjss = [[]]
+        if self._heads:
+            head = HeadFinder.head([leaf.label for leaf in leaves])
+            jjs = [leaf[0] for i, leaf in enumerate(leaves) if i != head]
+            return [LeafNounPhrase(leaves[head][0], jjs + _jjs) for _jjs in jjss]
+        collocation = [leaf[0] for leaf in leaves]
+        nps = [LeafNounPhrase(collocation[-1], _jjs) for _jjs in jjss]
+        if len(collocation) > 1:
+            self._collocations.append((collocation, nps))
+            if not self._batch: self.flush()
+        return nps
+
+    def flush(self):
+        collocations = self._collocations
+        self._collocations = []
+        if len(collocations) == 0: return
+        graphs = self._raw_parse_sents([" ".join(collocation) for collocation, _ in collocations])
+        IO.debug("collocations parsed = {}", len(graphs))
+        for (_, nps), graph in zip(collocations, graphs):
+            nn = None
+            jjs = []
+            for i, node in graph.nodes.items():
+                if node["word"] is None: continue
+                if node["head"] == 0:
+                    nn = node["word"]
+                else:
+                    jjs.append(node["word"])
+            for np in nps:
+                np.nn = Noun(nn)
+                np.jjs = [Adjective(jj) for jj in jjs] + np.jjs
 
-    @staticmethod
-    def pp(tree: Node) -> list:
+    def pp(self, tree: Node) -> list:
         pps = []
         for pp in tree.children(label="PP"):
             _in = [_in[0] for _in in pp.children(label="IN")]
             len_pps = len(pp.children(label="PP"))
             len_in = len(_in)
             if len_pps > 0 and len_in == 0:
-                pps.extend(StanfordCorrector.pp(pp))
+                pps.extend(self.pp(pp))
             elif len_pps == 0 and len_in > 0:
-                (_nps, _rpp) = StanfordCorrector.np(pp)
+                (_nps, _rpp) = self.np(pp)
                 pps.extend(_rpp)
                 pps.append(PrepositionalPhrase(_in[0], _nps))
             else:
                 _in = _in[0]
                 collocation = []
                 first_in = True
-                for word in list(pp.flatten()):
-                    if first_in and word == _in:
+                for leaf in pp.leaves():
+                    if first_in and leaf[0] == _in:
                         first_in = False
                     else:
-                        collocation.append(word)
-                pps.append(PrepositionalPhrase(_in, [StanfordCorrector.collocation(collocation)]))
+                        collocation.append(leaf)
+                pps.append(PrepositionalPhrase(_in, self.collocation(collocation)))
         return pps
 
     @staticmethod
-    def combine(inp: list) -> list:
-        if len(inp) == 0: return [[]]
-        result = deepcopy(inp)
-        while len(result) > 1:
-            result[0] = [i + j for i in result[0] for j in result[1]]
-            del result[1]
-        return result[0]
-
-    @staticmethod
-    def lnp(tree: Node) -> (list, list):
+    def combine(inp: list, limit=None, statistics=None):
+        seen = set()
+        for combination in product(*inp):
+            jjs = [jj for jjs in combination for jj in jjs]
+            key = tuple(jjs)
+            if key in seen: continue
+            if len(seen) == limit:
+                if statistics is not None: statistics["truncations"] += 1
+                IO.debug("adjective combinations truncated at {}", limit)
+                return
+            seen.add(key)
+            yield jjs
+
+    def lnp(self, tree: Node) -> (list, list):
         rpp = []
         collocations = [[]]
         jjsss = []
@@ -96,7 +163,7 @@ class StanfordCorrector(Corrector):
                     elif label in StanfordCorrector.word_level:
                         jjss[-1].append(jj[0])
                 jjsss.append([jjs for jjs in jjss if len(jjs) != 0])
-        jjss = StanfordCorrector.combine([jjss for jjss in jjsss if len(jjss) != 0])
+        jjsss = [jjss for jjss in jjsss if len(jjss) != 0]
         collocations = [collocation for collocation in collocations if len(collocation) != 0]
         nps = []
         for collocation in collocations:
@@ -106,40 +173,35 @@ class StanfordCorrector(Corrector):
                 if node.label == "POS":
                     _in.append(node[0])
                 else:
-                    _collocation.append(node[0])
+                    _collocation.append(node)
             if len(_in) > 0:
-                rpp.append(PrepositionalPhrase(_in[0], [StanfordCorrector.collocation(_collocation)]))
+                rpp.append(PrepositionalPhrase(_in[0], self.collocation(_collocation)))
             else:
-                parsed = StanfordCorrector.collocation(_collocation)
-                noun = parsed.nn.text
-                jjs = [jj.text for jj in parsed.jjs]
-                nps.extend([LeafNounPhrase(noun, jjs + _jjs) for _jjs in jjss])
+                nps.extend(self.collocation(_collocation, StanfordCorrector.combine(jjsss, self._limit, self.statistics)))
         return nps, rpp
 
-    @staticmethod
-    def np(tree: Node) -> (list, list):
+    def np(self, tree: Node) -> (list, list):
         result = []
         rpp = []
         for node in tree:
             label = node.label
             if label == "NP":
-                (nps, _rpp) = StanfordCorrector.lnp(node)
+                (nps, _rpp) = self.lnp(node)
                 rpp.extend(_rpp)
-                (_nps, pps) = StanfordCorrector.np(node)
+                (_nps, pps) = self.np(node)
                 nps.extend(_nps)
-                pps.extend(StanfordCorrector.pp(node))
+                pps.extend(self.pp(node))
                 result.extend(nps if len(pps) == 0 else [NounPhrase(nps, pps)])
             elif label in (StanfordCorrector.phrase_level | StanfordCorrector.clause_level) - {"VP", "PP"}:
-                result.append(StanfordCorrector.collocation(node.flatten()))
+                result.extend(self.collocation(node.leaves()))
         return result, rpp
 
-    @staticmethod
-    def sentence(tree: Node) -> Root:
-        (_nps, _rpp) = StanfordCorrector.np(tree)
+    def sentence(self, tree: Node) -> Root:
+        (_nps, _rpp) = self.np(tree)
         root = Root(_nps if len(_rpp) == 0 else [NounPhrase(_nps, _rpp)])
         for vp in tree.sub_children(label="VP"):
-            (nps, pps) = StanfordCorrector.np(vp)
-            pps.extend(StanfordCorrector.pp(vp))
+            (nps, pps) = self.np(vp)
+            pps.extend(self.pp(vp))
             verb_phrase = VerbPhrase()
             verb_phrase.nps = nps if len(pps) == 0 else [NounPhrase(nps, pps)]
             verb_phrase.vbs = [Verb(vb[0]) for vb in vp.children(labels=["VB", "VBD", "VBG", "VBN", "VBP", "VBZ"])]
@@ -148,8 +210,10 @@ class StanfordCorrector(Corrector):
 
     def correct(self, parsed: Node) -> Root:
         root = None
+        self._collocations = []
         if parsed.label in ["S", "SINV"]:
-            root = StanfordCorrector.sentence(parsed)
+            root = self.sentence(parsed)
+            self.flush()
             if root.label == "SINV":
                 for vp in root.vps: vp.nps.extend(root.nps)
                 root.nps = []
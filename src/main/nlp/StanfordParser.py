@@ -1,59 +1,250 @@
-from nltk import Tree
-from nltk.parse.stanford import StanfordParser as SParser
+from array import array
+from collections import Counter, OrderedDict
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING
 
 from src import IO
+from src.main import nlp
 from src.main.interfaces.Parser import Parser, Node
+from src.main.nlp.StanfordServer import StanfordServer
+
+if TYPE_CHECKING:
+    import nltk
+    import nltk.parse.stanford
+
+
+class StanfordTree:
+    __slots__ = ("labels", "words", "parents", "starts", "counts")
+
+    def __init__(self, tree: 'nltk.Tree'):
+        self.labels = []
+        self.words = bytearray()
+        self.parents = array("i", [-1])
+        self.starts = array("i")
+        self.counts = array("i")
+        queue = [tree]
+        for node in queue:
+            if isinstance(node, str):
+                self.labels.append(node)
+                self.words.append(1)
+                self.starts.append(len(queue))
+                self.counts.append(0)
+            else:
+                self.labels.append(node.label())
+                self.words.append(0)
+                self.starts.append(len(queue))
+                self.counts.append(len(node))
+                self.parents.extend([len(self.labels) - 1] * len(node))
+                queue.extend(node)
+
+    def children(self, index: int) -> range:
+        return range(self.starts[index], self.starts[index] + self.counts[index])
+
+    def isleaf(self, index: int) -> bool:
+        return any(self.words[child] for child in self.children(index))
 
 
 class StanfordNode(Node):
+    __slots__ = ("_tree", "_index")
+
+    @property
+    def label(self) -> str:
+        return self._tree.labels[self._index]
+
+    def __init__(self, tree: StanfordTree, index=0):
+        self._tree = tree
+        self._index = index
 
-    def __init__(self, label: str):
-        super().__init__(label)
+    def _node(self, index: int):
+        return self._tree.labels[index] if self._tree.words[index] else StanfordNode(self._tree, index)
 
     def _pformat_flat(self, node_separator, brackets, first):
         if self.isleaf():
             child_strings = [str(child) for child in self.children()]
         else:
             child_strings = [child._pformat_flat(node_separator, brackets, False) for child in self.children()]
-        if first: return '{}{} {}'.format(self._label, node_separator, ' '.join(child_strings))
-        return '{}{}{} {}{}'.format(brackets[0], self._label, node_separator, ' '.join(child_strings), brackets[1])
+        if first: return '{}{} {}'.format(self.label, node_separator, ' '.join(child_strings))
+        return '{}{}{} {}{}'.format(brackets[0], self.label, node_separator, ' '.join(child_strings), brackets[1])
 
     def pformat(self, margin=80, indent=0, node_separator='', brackets="()"):
         string = self._pformat_flat(node_separator, brackets, True)
         if len(string) + indent < margin: return string
-        string = "{}{}".format(self._label, node_separator)
-        for i, child in enumerate(self.children()):
-            edge = '├─ ' if i < len(self.children()) - 1 else '└─ '
+        string = "{}{}".format(self.label, node_separator)
+        children = self.children()
+        for i, child in enumerate(children):
+            edge = '├─ ' if i < len(children) - 1 else '└─ '
             string += '\n' + ' ' * indent + edge + child.pformat(margin, indent + 3, node_separator, brackets)
         return string + brackets[1]
 
     def __str__(self) -> str:
         return self.pformat()
 
+    def __getitem__(self, index):
+        return self.children()[index]
+
+    def __iter__(self):
+        return iter(self.children())
+
     def isleaf(self) -> bool:
-        return not all([not isinstance(child, str) for child in self.children()])
+        return self._tree.isleaf(self._index)
+
+    def _walk(self, leaves: bool) -> list:
+        tree = self._tree
+        result = []
+        stack = [self._index]
+        while stack:
+            index = stack.pop()
+            if leaves and tree.isleaf(index):
+                result.append(StanfordNode(tree, index))
+            elif tree.words[index]:
+                result.append(tree.labels[index])
+            else:
+                stack.extend(reversed(tree.children(index)))
+        return result
 
     def flatten(self) -> list:
-        return [word for child in self.children() for word in ([child] if isinstance(child, str) else child.flatten())]
+        return self._walk(False)
+
+    def leaves(self) -> list:
+        return self._walk(True)
+
+    def append(self, child: Node):
+        raise Exception("Unsupported operation")
+
+    def extend(self, children: list):
+        raise Exception("Unsupported operation")
+
+    def remove(self, **kwargs):
+        raise Exception("Unsupported operation")
+
+    def _matches(self, index: int, labels: set) -> list:
+        tree = self._tree
+        return [child for child in tree.children(index) if not tree.words[child] and tree.labels[child] in labels]
+
+    def children(self, **kwargs) -> list:
+        labels = StanfordNode._labels(**kwargs)
+        if labels is None: return [self._node(child) for child in self._tree.children(self._index)]
+        return [StanfordNode(self._tree, child) for child in self._matches(self._index, set(labels))]
+
+    def sub_children(self, **kwargs) -> list:
+        labels = StanfordNode._labels(**kwargs)
+        if labels is None:
+            children = self.children()
+        else:
+            labels = set(labels)
+            children = []
+
+            def collect(index: int):
+                matches = self._matches(index, labels)
+                for match in matches: collect(match)
+                children.extend(StanfordNode(self._tree, match) for match in matches)
+
+            for child in self._matches(self._index, labels): collect(child)
+        return children + self.children(**kwargs)
+
+    @staticmethod
+    def _labels(**kwargs) -> list:
+        if "labels" in kwargs: return kwargs["labels"]
+        elif "label" in kwargs: return [kwargs["label"]]
+        else: return None
 
 
 class StanfordParser(Parser):
     fixable_sentence = {"NP", "FRAG", "UCP", "PP", "ADJP", "INTJ"}
 
-    parser = SParser(model_path="edu/stanford/nlp/models/lexparser/englishPCFG.ser.gz")
+    _subprocess = None
+
+    _lock = Lock()
 
     @staticmethod
-    def convert(tree: Tree) -> Node:
-        root = StanfordNode(tree.label())
-        for child in tree: root.append(child if isinstance(child, str) else StanfordParser.convert(child))
-        return root
+    def subprocess() -> 'nltk.parse.stanford.StanfordParser':
+        with StanfordParser._lock:
+            if StanfordParser._subprocess is None:
+                from nltk.parse.stanford import StanfordParser as SParser
+                nlp.configure()
+                StanfordParser._subprocess = SParser(model_path=nlp.model_path)
+        return StanfordParser._subprocess
 
-    def parse(self, string: str) -> Node:
-        if len(string.split()) == 0: return None
-        root = next(StanfordParser.parser.raw_parse(string))[0]
-        label = root.label()
+    def __init__(self, server: StanfordServer = None, shapes=256):
+        self._server = server
+        self._parser = None
+        self.statistics = Counter()
+        self._shapes = OrderedDict()
+        self._shapes_size = shapes
+        self._pool = None
+
+    def _backend(self):
+        if self._parser is None:
+            self._parser = StanfordParser.subprocess() if self._server is None else self._server.parser()
+        return self._parser
+
+    def warm_up(self, string="show my repositories"):
+        self._raw_parse(string)
+
+    @staticmethod
+    def convert(tree: 'nltk.Tree') -> Node:
+        return StanfordNode(StanfordTree(tree))
+
+    def _raw_parse(self, string: str) -> 'nltk.Tree':
+        start = perf_counter()
+        try:
+            tree = next(self._backend().raw_parse(string))[0]
+        except StanfordServer.DeadServerException as ex:
+            IO.debug("parser server {} is dead, fall back to subprocess parser", ex)
+            self._parser = StanfordParser.subprocess()
+            tree = next(self._parser.raw_parse(string))[0]
+        elapsed = perf_counter() - start
+        self.statistics["parses"] += 1
+        self.statistics["time"] += elapsed
+        IO.debug("parse time = {}s, average = {}s ({})", round(elapsed, 3),
+                 round(self.statistics["time"] / self.statistics["parses"], 3), type(self._parser).__name__)
+        return tree
+
+    @staticmethod
+    def fixable(root: 'nltk.Tree') -> bool:
         children = [node for node in root if not isinstance(node, str) and node.label() in ["VP"]]
-        if label in StanfordParser.fixable_sentence | {"S"} and len(children) == 0:
-            root = next(StanfordParser.parser.raw_parse("show " + string))[0]
+        return root.label() in StanfordParser.fixable_sentence | {"S"} and len(children) == 0
+
+    def _speculate(self, string: str):
+        if self._pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            self._pool = ThreadPoolExecutor(max_workers=1)
+        return self._pool.submit(self._raw_parse, string)
+
+    def close(self):
+        if self._pool is not None: self._pool.shutdown(wait=False)
+        self._pool = None
+
+    def _shape(self, word: str) -> Counter:
+        shape = self._shapes.setdefault(word, Counter())
+        self._shapes.move_to_end(word)
+        while len(self._shapes) > self._shapes_size:
+            self._shapes.popitem(last=False)
+            self.statistics["shape evictions"] += 1
+        return shape
+
+    def parse(self, string: str) -> Node:
+        words = string.split()
+        if len(words) == 0: return None
+        shape = self._shape(words[0].lower())
+        self.statistics["utterances"] += 1
+        speculative = None
+        if shape["fixed"] > shape["plain"]:
+            self.statistics["predicted"] += 1
+            speculative = self._speculate("show " + string)
+        root = self._raw_parse(string)
+        if StanfordParser.fixable(root):
+            shape["fixed"] += 1
+            if speculative is None:
+                self.statistics["reparses"] += 1
+                root = self._raw_parse("show " + string)
+            else:
+                root = speculative.result()
+        else:
+            shape["plain"] += 1
+            if speculative is not None: self.statistics["mispredicted"] += 1
+        IO.debug("utterances = {}, predicted = {}, mispredicted = {}, reparses = {}", self.statistics["utterances"],
+                 self.statistics["predicted"], self.statistics["mispredicted"], self.statistics["reparses"])
         IO.log(root.label().lower() + ".txt", str(root))
         return StanfordParser.convert(root)
@@ -0,0 +1,113 @@
+from threading import Lock
+
+from src import IO
+from src.main import nlp
+
+
+class StanfordServer:
+
+    class DeadServerException(Exception):
+        pass
+
+    class Parser:
+        properties = {"annotators": "tokenize,ssplit,pos,parse", "ssplit.eolonly": "true", "parse.model": nlp.model_path}
+
+        def __init__(self, server: 'StanfordServer', factory):
+            self._server = server
+            self._factory = factory
+            self._parsers = {}
+
+        def _parser(self):
+            url = self._server.url
+            if url not in self._parsers: self._parsers[url] = self._factory(url=url)
+            return self._parsers[url]
+
+        def raw_parse(self, sentence: str):
+            properties = StanfordServer.Parser.properties
+            return iter(self._server.call(lambda: list(self._parser().raw_parse(sentence, properties=properties))))
+
+        def raw_parse_sents(self, sentences: list):
+            properties = StanfordServer.Parser.properties
+            text = "\n".join(sentences)
+            parsed = self._server.call(lambda: [list(trees) for trees in
+                                                self._parser().raw_parse_sents([text], properties=properties)])
+            return iter([iter(trees) for trees in parsed])
+
+    @property
+    def url(self) -> str:
+        if self._server is not None: return self._server.url
+        return "http://localhost:{}".format(self._port or "?")
+
+    @property
+    def restarts(self) -> int:
+        return self._restarts
+
+    def __init__(self, port=None, max_restarts=3):
+        self._port = port
+        self._max_restarts = max_restarts
+        self._restarts = 0
+        self._dead = False
+        self._server = None
+        self._lock = Lock()
+
+    def alive(self) -> bool:
+        return self._server is not None and self._server.popen is not None and self._server.popen.poll() is None
+
+    def start(self):
+        with self._lock:
+            if self.alive(): return
+            if self._dead: raise StanfordServer.DeadServerException(self.url)
+            if self._server is not None:
+                if self._restarts >= self._max_restarts:
+                    self._dead = True
+                    raise StanfordServer.DeadServerException(self.url)
+                self._restarts += 1
+                IO.debug("restart parser server {} ({})", self.url, self._restarts)
+            from nltk.parse.corenlp import CoreNLPServer, CoreNLPServerError
+            nlp.configure()
+            options = ["-preload", StanfordServer.Parser.properties["annotators"], "-parse.model", nlp.model_path]
+            server = None
+            try:
+                server = self._server = CoreNLPServer(port=self._port, corenlp_options=options)
+                server.start()
+            except (OSError, LookupError, CoreNLPServerError) as ex:
+                if server is not None:
+                    try:
+                        server.stop()
+                    except Exception as stop_ex:
+                        IO.debug("failed to stop parser server {}: {}", self.url, stop_ex)
+                self._dead = True
+                raise StanfordServer.DeadServerException("{} ({})".format(self.url, ex)) from ex
+
+    def stop(self):
+        with self._lock:
+            if self._server is None: return
+            if self.alive(): self._server.stop()
+            self._server = None
+
+    def restart(self):
+        with self._lock:
+            if self.alive(): self._server.popen.kill()
+        self.start()
+
+    def call(self, function):
+        from nltk.parse.corenlp import CoreNLPServerError
+        from requests.exceptions import ConnectionError
+        self.start()
+        try:
+            return function()
+        except (ConnectionError, CoreNLPServerError) as ex:
+            IO.debug("parser server {} failed: {}", self.url, ex)
+        self.restart()
+        try:
+            return function()
+        except (ConnectionError, CoreNLPServerError) as ex:
+            raise StanfordServer.DeadServerException("{} ({})".format(self.url, ex)) from ex
+
+    def parser(self) -> 'StanfordServer.Parser':
+        from nltk.parse.corenlp import CoreNLPParser
+        return StanfordServer.Parser(self, CoreNLPParser)
+
+    def dependency_parser(self) -> 'StanfordServer.Parser':
+        from nltk.parse.corenlp import CoreNLPDependencyParser
+        return StanfordServer.Parser(self, CoreNLPDependencyParser)
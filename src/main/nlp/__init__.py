@@ -2,10 +2,20 @@ import os
 
 home = os.getenv("HOME")
 stanford_dir = home + "/NLP"
-os.environ["STANFORD_DIR"] = stanford_dir
-os.environ["STANFORD_MODELS"] = "{0}/stanford-postagger-full/models:" \
-                                "{0}/stanford-ner/classifiers".format(stanford_dir)
-os.environ["CLASSPATH"] = "{0}/stanford-postagger-full/stanford-postagger.jar:" \
-                          "{0}/stanford-ner/stanford-ner.jar:" \
-                          "{0}/stanford-parser-full/stanford-parser.jar:" \
-                          "{0}/stanford-parser-full/stanford-parser-3.5.2-models.jar".format(stanford_dir)
\ No newline at end of file
+model_path = "edu/stanford/nlp/models/lexparser/englishPCFG.ser.gz"
+configured = False
+
+
+def configure():
+    global configured
+    if configured: return
+    configured = True
+    os.environ["STANFORD_DIR"] = stanford_dir
+    os.environ["STANFORD_MODELS"] = "{0}/stanford-postagger-full/models:" \
+                                    "{0}/stanford-ner/classifiers".format(stanford_dir)
+    os.environ["CLASSPATH"] = "{0}/stanford-postagger-full/stanford-postagger.jar:" \
+                              "{0}/stanford-ner/stanford-ner.jar:" \
+                              "{0}/stanford-parser-full/stanford-parser.jar:" \
+                              "{0}/stanford-parser-full/stanford-parser-3.5.2-models.jar".format(stanford_dir)
+    os.environ["CORENLP"] = "{0}/stanford-corenlp-full".format(stanford_dir)
+    os.environ["CORENLP_MODELS"] = "{0}/stanford-corenlp-full".format(stanford_dir)
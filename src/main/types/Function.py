@@ -3,6 +3,8 @@ from src.main import Utils
 
 
 class Function:
+    __slots__ = ("_result", "_args", "_body", "_cost")
+
     @property
     def result(self) -> Type:
         return self._result
@@ -15,19 +17,26 @@ class Function:
     def body(self):
         return self._body
 
-    def __init__(self, args: list, result: Type, body):
+    @property
+    def cost(self) -> int:
+        return self._cost
+
+    def __init__(self, args: list, result: Type, body, cost=0):
         self._result = result
         self._args = tuple(args)
         self._body = body
+        self._cost = cost
 
     def run(self, *args):
         return self._body(*args)
 
     def __str__(self):
-        return Utils.format("Function(args={}, result={}, body={})", self._args, self._result, self._body)
+        return Utils.format("Function(args={}, result={}, body={}, cost={})", self._args, self._result, self._body, self._cost)
 
 
 class WFunction(Function):
+    __slots__ = ("_mass", "_relevant_args")
+
     @property
     def mass(self):
         return self._mass
@@ -36,17 +45,23 @@ class WFunction(Function):
     def relevant_args(self):
         return self._relevant_args
 
+    @property
+    def score(self) -> tuple:
+        return self._mass, -len(self._relevant_args), self._cost
+
     def __init__(self, mass: float, relevant_args: list, function: Function):
-        super().__init__(function.args, function.result, function.body)
+        super().__init__(function.args, function.result, function.body, function.cost)
         self._mass = mass
         self._relevant_args = tuple(relevant_args)
 
     def __str__(self):
-        return Utils.format("WFunction(mass={}, relevant_args={}, args={}, result={}, body={})",
-                            self._mass, self._relevant_args, self._args, self._result, self._body)
+        return Utils.format("WFunction(mass={}, relevant_args={}, args={}, result={}, body={}, cost={})",
+                            self._mass, self._relevant_args, self._args, self._result, self._body, self._cost)
 
 
 class NullFunction(WFunction):
+    __slots__ = ()
+
     @property
     def result(self) -> Type:
         raise Exception("Unsupported operation")
@@ -2,6 +2,8 @@ from abc import ABCMeta, abstractmethod
 
 
 class Node(metaclass=ABCMeta):
+    __slots__ = ("_label",)
+
     @property
     def label(self) -> str:
         return self._label
@@ -36,6 +38,8 @@ class Node(metaclass=ABCMeta):
 
 
 class VerbPhrase(Node):
+    __slots__ = ("nps", "pps", "vbs")
+
     def __init__(self, nps=None, pps=None, vbs=None):
         super().__init__("VP")
         self.nps = [] if nps is None else nps
@@ -47,6 +51,8 @@ class VerbPhrase(Node):
 
 
 class NounPhrase(Node):
+    __slots__ = ("nps", "pps")
+
     def __init__(self, nps=None, pps=None):
         super().__init__("NP")
         self.nps = [] if nps is None else nps
@@ -57,6 +63,8 @@ class NounPhrase(Node):
 
 
 class LeafNounPhrase(Node):
+    __slots__ = ("nn", "jjs")
+
     def __init__(self, nn=None, jjs=None):
         super().__init__("LNP")
         self.nn = Noun(nn)
@@ -67,6 +75,8 @@ class LeafNounPhrase(Node):
 
 
 class PrepositionalPhrase(Node):
+    __slots__ = ("pretext", "nps")
+
     def __init__(self, pretext=None, nps=None):
         super().__init__("PP")
         self.pretext = Pretext(pretext)
@@ -77,6 +87,8 @@ class PrepositionalPhrase(Node):
 
 
 class Root(Node):
+    __slots__ = ("nps", "vps")
+
     def __init__(self, nps=None, vps=None):
         super().__init__("R")
         self.nps = [] if nps is None else nps
@@ -87,6 +99,8 @@ class Root(Node):
 
 
 class Word(Node, metaclass=ABCMeta):
+    __slots__ = ("text",)
+
     def __init__(self, label: str, text: str):
         super().__init__(label)
         self.text = text
@@ -96,20 +110,28 @@ class Word(Node, metaclass=ABCMeta):
 
 
 class Noun(Word):
+    __slots__ = ()
+
     def __init__(self, text: str):
         super().__init__("NN", text)
 
 
 class Adjective(Word):
+    __slots__ = ()
+
     def __init__(self, text: str):
         super().__init__("JJ", text)
 
 
 class Verb(Word):
+    __slots__ = ()
+
     def __init__(self, text: str):
         super().__init__("VB", text)
 
 
 class Pretext(Word):
+    __slots__ = ()
+
     def __init__(self, text: str):
         super().__init__("IN", text)
@@ -1,18 +1,28 @@
 from abc import abstractmethod, ABCMeta
-from copy import deepcopy
+from copy import copy
+from typing import TYPE_CHECKING
 
-from src.main.Utils import subclasses
 from src.main.nlp.Number import Number
 from src.main.types.Function import Function
+from src.main.types.Pages import Pages
 from src.main.types.Types import Type
 from src.main.types import Types
 
-import github.Gist
-import github.Repository
-import github.NamedUser
+if TYPE_CHECKING:
+    import github.Gist
+    import github.NamedUser
+    import github.Repository
 
 
 class Object(metaclass=ABCMeta):
+    __slots__ = ("_type", "_object", "_label")
+
+    _registry = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Object._registry[cls.__name__.lower()] = cls
+
     @property
     def type(self) -> Type:
         return self._type
@@ -21,25 +31,26 @@ class Object(metaclass=ABCMeta):
     def object(self):
         return self._object
 
+    @property
+    def identity(self):
+        return self._object
+
     @staticmethod
     def create(_type: Type, _object) -> 'Object':
-        instance = None
-        objects = {subclass.__name__.lower(): subclass for subclass in subclasses(Object)}
-        type_name = _type[0].lower()
-        for name, subclass in objects.items():
-            if name == type_name:
-                instance = subclass(_object, _type)
-                break
-        if instance is None: raise Exception("Constructor with type {} not found".format(str(_type)))
-        return instance
-
-    def __init__(self, _type: Type, _object, expected: Type, simplifier=None):
+        subclass = Object._registry.get(_type[0].lower())
+        if subclass is None: raise Exception("Constructor with type {} not found".format(str(_type)))
+        return subclass(_object, _type)
+
+    _simplifier = Function([Types.Any()], Types.String(), lambda this: String(str(this)))
+
+    _paths = {}
+
+    def __init__(self, _type: Type, _object, expected: Type):
         if not _type.isinstance(_object): raise Exception("Object is not {}".format(str(_type)))
         if expected[0] != _type[0]: raise Exception("Wut {} != {}".format(_type, expected))
         self._type = _type
         self._object = _object
-        if simplifier is None: simplifier = Function([_type], Types.String(), lambda this: String(str(this)))
-        self._simplifier = simplifier
+        self._label = None
 
     @abstractmethod
     def __str__(self) -> str:
@@ -48,16 +59,18 @@ class Object(metaclass=ABCMeta):
     def __eq__(self, other) -> bool:
         if not isinstance(other, Object): return False
         if self._type != other._type: return False
-        return self._object == other._object
+        return self.identity == other.identity
 
     def __ne__(self, other) -> bool:
         return not self.__eq__(other)
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return hash((self._type, self.identity))
 
     def __deepcopy__(self, memo=None):
-        return Object.create(self._type, self._object)
+        copied = Object.create(self._type, self._object)
+        copied._label = self._label
+        return copied
 
     @staticmethod
     def valueOf(string: str) -> 'Object':
@@ -70,17 +83,37 @@ class Object(metaclass=ABCMeta):
         else:
             return String(string)
 
+    def lines(self):
+        return str(self).split("\n")
+
     def simplify(self) -> 'Object':
         return self._simplifier.run(self._object)
 
+    @classmethod
+    def _simple(cls, _object):
+        return cls._simplifier.run(_object).object
+
+    @staticmethod
+    def path(_type: Type) -> tuple:
+        if _type not in Object._paths:
+            path = [_type]
+            while True:
+                simple = Object._registry[path[-1][0].lower()]._simplifier.result
+                if simple in path: break
+                path.append(simple)
+            Object._paths[_type] = tuple(path)
+        return Object._paths[_type]
+
+    def label(self) -> str:
+        return self._label
+
     def mark(self, label: str) -> 'Object':
-        labeled = deepcopy(self)
-        setattr(labeled, "label", lambda: label)
-        setattr(labeled, "__deepcopy__", lambda memo=None: deepcopy(self).mark(label))
-        return labeled
+        return Labeled(self, label)
 
 
 class List(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> list:
         return self._object
@@ -89,30 +122,46 @@ class List(Object):
     def type(self) -> Types.List:
         return self._type
 
+    @property
+    def identity(self):
+        if isinstance(self._object, Pages): return self._object
+        return tuple(Object.create(self.type.generic, element).identity for element in self._object)
+
     def __init__(self, _object, expected=Types.List(Types.Any())):
         super().__init__(Types.List.create(_object, expected.generic), _object, expected)
 
     def __str__(self):
-        self._object = list(self._object)
-        if len(self._object) == 0:
-            return "List of {} is empty".format(self._type.generic)
-        else:
-            return '\n'.join([str(Object.create(self.type.generic, element)) for element in self._object])
+        return '\n'.join(self.lines())
+
+    def lines(self):
+        empty = True
+        for element in self._object:
+            empty = False
+            yield from Object.create(self.type.generic, element).lines()
+        if empty: yield "List of {} is empty".format(self._type.generic)
 
     def simplify(self) -> 'List':
+        if isinstance(self._object, Pages):
+            subclass = Object._registry[self._type.generic[0].lower()]
+            simple = copy(self)
+            simple._type = Types.List(subclass._simplifier.result)
+            simple._object = self._object.map(subclass._simple)
+            return simple
         simple_type = Types.Null()
         result = []
-        self._object = list(self._object)
         for elem in self._object:
             simple = Object.create(Type.valueOf(self._type[1:]), elem).simplify()
             simple_type = simple._type
             result.append(simple._object)
-        self._type = Types.List(simple_type)
-        self._object = result
-        return self
+        simple = copy(self)
+        simple._type = Types.List(simple_type)
+        simple._object = result
+        return simple
 
 
 class String(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -130,10 +179,16 @@ class String(Object):
 
 
 class Any(Object):
+    __slots__ = ()
+
     @property
     def type(self) -> Types.Any:
         return self._type
 
+    @property
+    def identity(self):
+        return str(self._object)
+
     def __init__(self, _object, expected=Types.Any()):
         super().__init__(Types.Any(), _object, expected)
 
@@ -143,6 +198,8 @@ class Any(Object):
 
 
 class Null(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> None:
         return self._object
@@ -166,6 +223,8 @@ class Null(Object):
 
 
 class Integer(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> Number:
         return self._object
@@ -174,9 +233,14 @@ class Integer(Object):
     def type(self) -> Types.Integer:
         return self._type
 
+    @property
+    def identity(self):
+        return str(self._object)
+
+    _simplifier = Function([Types.Integer()], Types.String(), lambda _integer: String(_integer[-1]))
+
     def __init__(self, _object, expected=Types.Integer()):
-        super().__init__(Types.Integer(), _object, expected,
-                         simplifier=Function([Types.Integer()], Types.String(), lambda _integer: String(_integer[-1])))
+        super().__init__(Types.Integer(), _object, expected)
 
     def __str__(self) -> str:
         _str = str(self._object) if self._object else "───║───"
@@ -184,6 +248,8 @@ class Integer(Object):
 
 
 class Email(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -202,6 +268,8 @@ class Email(Object):
 
 
 class Url(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -220,6 +288,8 @@ class Url(Object):
 
 
 class Id(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -238,6 +308,8 @@ class Id(Object):
 
 
 class Key(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -257,6 +329,8 @@ class Key(Object):
 
 
 class Login(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -274,6 +348,8 @@ class Login(Object):
 
 
 class Name(Object):
+    __slots__ = ()
+
     @property
     def object(self) -> str:
         return self._object
@@ -291,17 +367,25 @@ class Name(Object):
 
 
 class Gist(Object):
+    __slots__ = ("_identity",)
+
     @property
-    def object(self) -> github.Gist.Gist:
+    def object(self) -> 'github.Gist.Gist':
         return self._object
 
     @property
     def type(self) -> Types.Gist:
         return self._type
 
+    @property
+    def identity(self) -> str:
+        return self._identity
+
+    _simplifier = Function([Types.Gist()], Types.Id(), lambda gist: Id(gist.id))
+
     def __init__(self, _object, expected=Types.Gist()):
-        super().__init__(Types.Gist(), _object, expected,
-                         simplifier=Function([Types.Gist()], Types.Id(), lambda gist: Id(gist.id)))
+        super().__init__(Types.Gist(), _object, expected)
+        self._identity = _object.url
 
     def __str__(self) -> str:
         login = str(Login(self._object.owner.login))
@@ -310,17 +394,25 @@ class Gist(Object):
 
 
 class Repo(Object):
+    __slots__ = ("_identity",)
+
     @property
-    def object(self) -> github.Repository.Repository:
+    def object(self) -> 'github.Repository.Repository':
         return self._object
 
     @property
     def type(self) -> Types.Repo:
         return self._type
 
+    @property
+    def identity(self) -> str:
+        return self._identity
+
+    _simplifier = Function([Types.Repo()], Types.Id(), lambda repo: Id(repo.id))
+
     def __init__(self, _object, expected=Types.Repo()):
-        super().__init__(Types.Repo(), _object, expected,
-                         simplifier=Function([Types.Repo()], Types.Id(), lambda repo: Id(repo.id)))
+        super().__init__(Types.Repo(), _object, expected)
+        self._identity = _object.url
 
     def __str__(self) -> str:
         login = str(Login(self._object.owner.login))
@@ -330,20 +422,61 @@ class Repo(Object):
 
 
 class User(Object):
+    __slots__ = ("_identity",)
+
     @property
-    def object(self) -> github.NamedUser.NamedUser:
+    def object(self) -> 'github.NamedUser.NamedUser':
         return self._object
 
     @property
     def type(self) -> Types.User:
         return self._type
 
+    @property
+    def identity(self) -> str:
+        return self._identity
+
+    _simplifier = Function([Types.User()], Types.Login(), lambda user: Login(user.login))
+
     def __init__(self, _object, expected=Types.User()):
-        super().__init__(Types.User(), _object, expected,
-                         simplifier=Function([Types.User()], Types.Login(), lambda user: Login(user.login)))
+        super().__init__(Types.User(), _object, expected)
+        self._identity = _object.url
 
     def __str__(self) -> str:
         login = str(Login(self.object.login))
         name = "({})".format(str(Name(self.object.name))) if self.object.name is not None else ""
         email = "<{}>".format(str(Email(self.object.email))) if self.object.email is not None else ""
         return "{}{} {}".format(login, name, email)
+
+
+class Labeled(Object):
+    __slots__ = ("_target",)
+
+    @property
+    def target(self) -> Object:
+        return self._target
+
+    @property
+    def identity(self):
+        return self._target.identity
+
+    def __init__(self, target: Object, label: str):
+        self._type = target.type
+        self._object = target.object
+        self._label = label
+        self._target = target
+
+    def __str__(self) -> str:
+        return str(self._target)
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def lines(self):
+        return self._target.lines()
+
+    def simplify(self) -> Object:
+        return self._target.simplify()
+
+    def mark(self, label: str) -> 'Labeled':
+        return Labeled(self._target, label)
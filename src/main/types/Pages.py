@@ -0,0 +1,75 @@
+class Pages:
+    __slots__ = ("_paginated", "_per_page", "_pages", "_length")
+
+    per_page = 100
+
+    @property
+    def paginated(self):
+        return self._paginated
+
+    def __init__(self, paginated, per_page=None):
+        self._paginated = paginated
+        self._per_page = Pages.per_page if per_page is None else per_page
+        self._pages = {}
+        self._length = None
+
+    def page(self, number: int) -> list:
+        if number not in self._pages: self._pages[number] = self._paginated.get_page(number)
+        return self._pages[number]
+
+    def __iter__(self):
+        number = 0
+        while True:
+            page = self.page(number)
+            yield from page
+            if len(page) < self._per_page: return
+            number += 1
+
+    def __len__(self) -> int:
+        if self._length is None: self._length = self._paginated.totalCount
+        return self._length
+
+    def __getitem__(self, index: int):
+        if index < 0: index += len(self)
+        page = self.page(index // self._per_page) if index >= 0 else []
+        if index % self._per_page >= len(page): raise IndexError("Pages index out of range")
+        return page[index % self._per_page]
+
+    def __eq__(self, other) -> bool:
+        return type(other) is Pages and self._paginated is other._paginated
+
+    def __hash__(self) -> int:
+        return id(self._paginated)
+
+    def map(self, foo) -> 'Mapped':
+        return Mapped(self, foo)
+
+
+class Mapped(Pages):
+    __slots__ = ("_source", "_foo")
+
+    @property
+    def paginated(self):
+        return self._source.paginated
+
+    def __init__(self, source: Pages, foo):
+        self._source = source
+        self._foo = foo
+
+    def page(self, number: int) -> list:
+        return [self._foo(element) for element in self._source.page(number)]
+
+    def __iter__(self):
+        for element in self._source: yield self._foo(element)
+
+    def __len__(self) -> int:
+        return len(self._source)
+
+    def __getitem__(self, index: int):
+        return self._foo(self._source[index])
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Mapped) and self._source == other._source and self._foo == other._foo
+
+    def __hash__(self) -> int:
+        return hash((self._source, self._foo))
@@ -1,18 +1,37 @@
+from collections import Counter
 from copy import copy, deepcopy
 
 
 class Shell:
+    __slots__ = ("_adjectives", "_adjective_set", "_functions", "_arities", "_wins", "_order")
+
     @property
     def adjectives(self):
         return self._adjectives
 
+    @property
+    def adjective_set(self) -> frozenset:
+        return self._adjective_set
+
     @property
     def functions(self):
         return self._functions
 
     def __init__(self, adjectives: list, functions: list):
         self._adjectives = adjectives
+        self._adjective_set = frozenset(adjectives)
         self._functions = functions
+        self._arities = sorted({len(function.args) for function in functions})
+        self._wins = Counter()
+        self._order = list(enumerate(functions))
+
+    def candidates(self, available: int) -> list:
+        if len(self._arities) == 0 or self._arities[-1] <= available: return self._order
+        return [(i, function) for i, function in self._order if len(function.args) <= available]
+
+    def win(self, index: int):
+        self._wins[index] += 1
+        self._order = sorted(self._order, key=lambda pair: (-self._wins[pair[0]], pair[0]))
 
     def difference(self, adjectives: list) -> list:
         copy_list = deepcopy(self._adjectives)
@@ -1,16 +1,25 @@
 import re
 from abc import ABCMeta
+from threading import Lock
 
-import github.Gist
-import github.Repository
-import github.NamedUser
-import github.AuthenticatedUser
-from sphinx.util.pycompat import NoneType
-from src.main.Utils import subclasses as _subclasses
 from src.main.nlp.Number import Number
+from src.main.types.Pages import Pages
+
+NoneType = type(None)
 
 
 class Type(metaclass=ABCMeta):
+    __slots__ = ("_blocks", "_name", "_generic", "_hash")
+
+    _registry = {}
+
+    _candidates = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Type._registry[cls.__name__.lower()] = cls
+        Type._candidates.clear()
+
     @property
     def blocks(self) -> tuple:
         return self._blocks
@@ -23,7 +32,8 @@ class Type(metaclass=ABCMeta):
         if len(args) == 0: raise Exception("Illegal type name")
         self._blocks = tuple(args)
         self._name = self._blocks[0]
-        self._generic = Type.valueOf(self._blocks[1:]) if len(self._blocks) > 1 else None
+        self._generic = None
+        self._hash = hash(self._blocks)
 
     def __str__(self) -> str:
         return ' '.join(self._blocks)
@@ -32,15 +42,22 @@ class Type(metaclass=ABCMeta):
         return self._blocks[index]
 
     def __eq__(self, other):
-        if not isinstance(other, Type): return False
-        if len(self._blocks) != len(other._blocks): return False
-        return all([e1 == e2 for e1, e2 in zip(self._blocks, other._blocks)])
+        return self is other
 
     def __ne__(self, other):
-        return not self.__eq__(other)
+        return self is not other
 
     def __hash__(self):
-        return hash(str(self))
+        return self._hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo=None):
+        return self
+
+    def __reduce__(self):
+        return Type.valueOf, (list(self._blocks),)
 
     @staticmethod
     def isurl(string: str) -> bool:
@@ -61,28 +78,24 @@ class Type(metaclass=ABCMeta):
     @staticmethod
     def extract(words: list) -> list:
         result = []
-        types = {subclass.__name__.lower() for subclass in _subclasses(Type)}
         for word in words:
             if not isinstance(word, str): continue
             word = word.lower()
-            blocks = ["list", word[:-1]] if len(word) > 1 and word[-1] == "s" and word[:-1] in types else [word]
-            for type_name in types:
-                if type_name == blocks[0]:
-                    _type = Type.valueOf(blocks)
-                    if _type is not None: result.append(_type)
-                    break
+            blocks = ["list", word[:-1]] if len(word) > 1 and word[-1] == "s" and word[:-1] in Type._registry else [word]
+            if blocks[0] in Type._registry:
+                _type = Type.valueOf(blocks)
+                if _type is not None: result.append(_type)
         return result
 
     @staticmethod
     def type(element) -> 'Type':
-        result = None
-        for subclass in _subclasses(Type):
-            if subclass.isinstance(element) and (result is None or result._mass > subclass._mass):
-                result = subclass
+        candidates = Type._candidates.get(type(element))
+        if candidates is None:
+            candidates = [subclass for subclass in Type._registry.values() if issubclass(type(element), subclass.inner())]
+            candidates = Type._candidates[type(element)] = sorted(candidates, key=lambda subclass: subclass._mass)
+        result = next((subclass for subclass in candidates if subclass.isinstance(element)), None)
         if result is None: raise Exception("{} object's type not found".format(element.__name__))
-        result = result()
-        result._blocks = result._blocks + tuple(result.get_generic(element, Any()))
-        return result
+        return result.create(element, Any())
 
     _mass = 0
 
@@ -90,9 +103,13 @@ class Type(metaclass=ABCMeta):
 
     _primitive = True
 
+    @classmethod
+    def inner(cls):
+        return cls._inner
+
     @classmethod
     def isinstance(cls, element) -> bool:
-        return isinstance(element, cls._inner)
+        return isinstance(element, cls.inner())
 
     def isprimitive(self) -> bool:
         return self._primitive and (self._generic is None or self._generic.isprimitive())
@@ -100,32 +117,55 @@ class Type(metaclass=ABCMeta):
     @staticmethod
     def valueOf(blocks: list) -> 'Type':
         if len(blocks) == 0: return Null()
-        for subclass in _subclasses(Type):
-            if subclass.__name__.lower() == blocks[0].lower():
-                result = subclass()
-                if len(blocks) > 1: result._generic = Type.valueOf(blocks[1:])
-                return result
-        return Null()
+        subclass = Type._registry.get(blocks[0].lower())
+        if subclass is None: return Null()
+        return subclass.parametrize(Type.valueOf(blocks[1:])) if len(blocks) > 1 else subclass()
+
+    @classmethod
+    def parametrize(cls, generic: 'Type') -> 'Type':
+        return cls()
+
+    @classmethod
+    def create(cls, element, expected) -> 'Type':
+        return cls()
 
     @staticmethod
     def get_generic(element, expected) -> 'Type': return ()
 
 
 class List(Type):
+    __slots__ = ()
+
+    _instances = {}
+
+    _lock = Lock()
+
+    _inner = (list, Pages)
+
     @property
     def generic(self):
         return self._generic
 
-    def __init__(self, generic=None):
+    def __new__(cls, generic=None) -> 'List':
         if generic is None: generic = Any()
-        super().__init__("list", *list(generic))
-        List._inner = list
+        with List._lock:
+            instance = List._instances.get(generic)
+            if instance is None:
+                instance = object.__new__(List)
+                Type.__init__(instance, "list", *generic.blocks)
+                instance._generic = generic
+                List._instances[generic] = instance
+        return instance
+
+    def __init__(self, generic=None):
+        pass
 
     def __str__(self) -> str:
         return "{}s".format(str(self._generic))
 
     @staticmethod
     def get_generic(element, expected) -> 'Type':
+        if isinstance(element, Pages): return expected
         generic = None
         for elem in list(element):
             _type = Type.type(elem)
@@ -136,14 +176,24 @@ class List(Type):
                 break
         return expected if generic is None else generic
 
-    @staticmethod
-    def create(element, expected) -> 'List':
+    @classmethod
+    def parametrize(cls, generic: Type) -> 'List':
+        return List(generic)
+
+    @classmethod
+    def create(cls, element, expected) -> 'List':
         return List(List.get_generic(element, expected))
 
 
 class String(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = str
+
+    _mass = 3
+
     def __new__(cls) -> 'String':
         return object.__new__(String) if String._instance is None else String._instance
 
@@ -151,13 +201,17 @@ class String(Type):
         if String._instance is None:
             String._instance = self
             super().__init__("string")
-            String._inner = str
-            String._mass = 3
 
 
 class Any(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = object
+
+    _mass = float("inf")
+
     def __new__(cls) -> 'Any':
         return object.__new__(Any) if Any._instance is None else Any._instance
 
@@ -165,11 +219,11 @@ class Any(Type):
         if Any._instance is None:
             Any._instance = self
             super().__init__("any")
-            Any._inner = object
-            Any._mass = float("inf")
 
 
 class Null(Type):
+    __slots__ = ()
+
     _instance = None
 
     def __new__(cls) -> 'Null':
@@ -182,8 +236,12 @@ class Null(Type):
 
 
 class Integer(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = Number
+
     def __new__(cls) -> 'Integer':
         return object.__new__(Integer) if Integer._instance is None else Integer._instance
 
@@ -191,12 +249,17 @@ class Integer(Type):
         if Integer._instance is None:
             Integer._instance = self
             super().__init__("integer")
-            Integer._inner = Number
 
 
 class Email(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = str
+
+    _primitive = False
+
     def __new__(cls) -> 'Email':
         return object.__new__(Email) if Email._instance is None else Email._instance
 
@@ -204,17 +267,21 @@ class Email(Type):
         if Email._instance is None:
             Email._instance = self
             super().__init__("email")
-            Email._inner = str
-            Email._primitive = False
 
     @classmethod
     def isinstance(cls, element) -> bool:
-        return isinstance(element, cls._inner) and Type.isemail(element)
+        return isinstance(element, cls.inner()) and Type.isemail(element)
 
 
 class Url(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = str
+
+    _primitive = False
+
     def __new__(cls) -> 'Url':
         return object.__new__(Url) if Url._instance is None else Url._instance
 
@@ -222,17 +289,21 @@ class Url(Type):
         if Url._instance is None:
             Url._instance = self
             super().__init__("url")
-            Url._inner = str
-            Url._primitive = False
 
     @classmethod
     def isinstance(cls, element) -> bool:
-        return isinstance(element, cls._inner) and Type.isurl(element)
+        return isinstance(element, cls.inner()) and Type.isurl(element)
 
 
 class Id(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = (str, int)
+
+    _primitive = False
+
     def __new__(cls) -> 'Id':
         return object.__new__(Id) if Id._instance is None else Id._instance
 
@@ -240,13 +311,17 @@ class Id(Type):
         if Id._instance is None:
             Id._instance = self
             super().__init__("id")
-            Id._inner = (str, int)
-            Id._primitive = False
 
 
 class Key(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = str
+
+    _primitive = False
+
     def __new__(cls) -> 'Key':
         return object.__new__(Key) if Key._instance is None else Key._instance
 
@@ -254,13 +329,17 @@ class Key(Type):
         if Key._instance is None:
             Key._instance = self
             super().__init__("key")
-            Key._inner = str
-            Key._primitive = False
 
 
 class Login(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = str
+
+    _primitive = False
+
     def __new__(cls) -> 'Login':
         return object.__new__(Login) if Login._instance is None else Login._instance
 
@@ -268,13 +347,17 @@ class Login(Type):
         if Login._instance is None:
             Login._instance = self
             super().__init__("login")
-            Login._inner = str
-            Login._primitive = False
 
 
 class Name(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _inner = str
+
+    _primitive = False
+
     def __new__(cls) -> 'Name':
         return object.__new__(Name) if Name._instance is None else Name._instance
 
@@ -282,13 +365,15 @@ class Name(Type):
         if Name._instance is None:
             Name._instance = self
             super().__init__("name")
-            Name._inner = str
-            Name._primitive = False
 
 
 class Gist(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _primitive = False
+
     def __new__(cls) -> 'Gist':
         return object.__new__(Gist) if Gist._instance is None else Gist._instance
 
@@ -296,13 +381,20 @@ class Gist(Type):
         if Gist._instance is None:
             Gist._instance = self
             super().__init__("gist")
-            Gist._inner = github.Gist.Gist
-            Gist._primitive = False
+
+    @classmethod
+    def inner(cls):
+        import github.Gist
+        return github.Gist.Gist
 
 
 class Repo(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _primitive = False
+
     def __new__(cls) -> 'Repo':
         return object.__new__(Repo) if Repo._instance is None else Repo._instance
 
@@ -310,13 +402,20 @@ class Repo(Type):
         if Repo._instance is None:
             Repo._instance = self
             super().__init__("repo")
-            Repo._inner = github.Repository.Repository
-            Repo._primitive = False
+
+    @classmethod
+    def inner(cls):
+        import github.Repository
+        return github.Repository.Repository
 
 
 class User(Type):
+    __slots__ = ()
+
     _instance = None
 
+    _primitive = False
+
     def __new__(cls) -> 'User':
         return object.__new__(User) if User._instance is None else User._instance
 
@@ -324,5 +423,13 @@ class User(Type):
         if User._instance is None:
             User._instance = self
             super().__init__("user")
-            User._inner = (github.NamedUser.NamedUser, github.AuthenticatedUser.AuthenticatedUser)
-            User._primitive = False
+
+    @classmethod
+    def inner(cls):
+        import github.NamedUser
+        import github.AuthenticatedUser
+        return github.NamedUser.NamedUser, github.AuthenticatedUser.AuthenticatedUser
+
+
+for _subclass in list(Type._registry.values()):
+    if _subclass is not List: _subclass()
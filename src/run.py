@@ -1,3 +1,5 @@
+import os
+
 from src.main.Bot import Bot
 
-Bot(bot_nick="PythonBot").start()
+Bot(bot_nick="PythonBot", parser_server=os.getenv("PARSER_SERVER") == "true", cache_path=os.getenv("PARSE_CACHE")).start()
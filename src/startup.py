@@ -0,0 +1,74 @@
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+env = dict(os.environ, PYTHONPATH=os.pathsep.join([root, os.path.join(root, "src")]))
+
+
+def imports(module="src.main.Bot", top=15) -> list:
+    command = [sys.executable, "-X", "importtime", "-c", "import " + module]
+    result = subprocess.run(command, env=env, stderr=subprocess.PIPE, universal_newlines=True)
+    times = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line: continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if name[1:].startswith(" "): continue
+        times.append((int(cumulative), name.strip()))
+    return sorted(times, reverse=True)[:top]
+
+
+def first_prompt(runs=5) -> float:
+    best = float("inf")
+    with tempfile.NamedTemporaryFile("w", suffix=".txt") as inp:
+        inp.write("bye\n")
+        inp.flush()
+        for _ in range(runs):
+            start = perf_counter()
+            process = subprocess.Popen([sys.executable, os.path.join(root, "src", "run.py")],
+                                       env=dict(env, INPUT=inp.name), stdout=subprocess.PIPE, universal_newlines=True)
+            process.stdout.readline()
+            best = min(best, perf_counter() - start)
+            process.communicate()
+    return best
+
+
+def parse_latency(sentences=("show my repositories", "show avatar url of saloed"), runs=3) -> list:
+    sys.path[:0] = [root, os.path.join(root, "src")]
+    from src.main.nlp.StanfordParser import StanfordParser
+    from src.main.nlp.StanfordServer import StanfordServer
+    server = StanfordServer()
+    latencies = []
+    try:
+        for name, parser in (("subprocess", StanfordParser()), ("server", StanfordParser(server))):
+            try:
+                start = perf_counter()
+                parser.parse(sentences[0])
+                first = perf_counter() - start
+                best = float("inf")
+                for _ in range(runs):
+                    start = perf_counter()
+                    for sentence in sentences: parser.parse(sentence)
+                    best = min(best, (perf_counter() - start) / len(sentences))
+                latencies.append((name, type(parser._backend()).__name__, first, best))
+            except Exception as ex:
+                reason = next((line.strip() for line in str(ex).splitlines() if line.strip(" =")), type(ex).__name__)
+                latencies.append((name, "unavailable: {}".format(reason), None, None))
+    finally:
+        server.stop()
+    return latencies
+
+
+if __name__ == "__main__":
+    for cumulative, name in imports():
+        print("{:>10.1f}ms  {}".format(cumulative / 1000, name))
+    print("time to first prompt = {:.1f}ms".format(first_prompt() * 1000))
+    if "--parser" in sys.argv:
+        for name, backend, first, best in parse_latency():
+            if first is None:
+                print("{:>10}  {}".format(name, backend))
+            else:
+                print("{:>10}  first parse = {:.1f}ms, parse = {:.1f}ms ({})".format(name, first * 1000, best * 1000,
+                                                                                      backend))
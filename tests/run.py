@@ -0,0 +1,8 @@
+import os
+import sys
+import unittest
+
+if __name__ == "__main__":
+    suite = unittest.defaultTestLoader.discover(os.path.dirname(os.path.abspath(__file__)))
+    result = unittest.TextTestRunner(verbosity=2).run(suite)
+    sys.exit(not result.wasSuccessful())
@@ -0,0 +1,37 @@
+from github import Github
+
+from src.main.Connector import Connector
+from src.main.types.Pages import Pages
+
+
+class StubConnector(Connector):
+    api = "https://api.github.com"
+
+    repos = 350
+
+    def __init__(self):
+        super().__init__()
+        self.requests = []
+
+    def _user_json(self, login: str) -> dict:
+        url = "{}/users/{}".format(StubConnector.api, login)
+        return {"login": login, "name": login.capitalize(), "url": url, "repos_url": url + "/repos",
+                "avatar_url": "https://avatars.githubusercontent.com/{}".format(login),
+                "organizations_url": url + "/orgs"}
+
+    def _request(self, verb, url, parameters=None, headers=None, input=None, follow_302_redirect=False):
+        self.requests.append(url)
+        login = url.split("/users/")[-1].split("/")[0]
+        if not url.endswith("/repos"): return {}, self._user_json(login)
+        page, per_page = parameters.get("page", 1), parameters["per_page"]
+        repos = [{"id": i, "name": "repo{}".format(i), "url": "{}/repos/{}/repo{}".format(StubConnector.api, login, i)}
+                 for i in range(StubConnector.repos)][(page - 1) * per_page:page * per_page]
+        last = -(-StubConnector.repos // per_page)
+        link = '<{}?per_page={}&page={}>; rel="last"'.format(url, per_page, last)
+        return {"link": link} if page < last else {}, repos
+
+    @property
+    def _git(self):
+        git = Github(per_page=Pages.per_page)
+        git._Github__requester.requestJsonAndCheck = self._request
+        return git
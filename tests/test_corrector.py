@@ -0,0 +1,45 @@
+import unittest
+
+from nltk import Tree
+
+from src.main.nlp.StanfordCorrector import StanfordCorrector
+from src.main.nlp.StanfordParser import StanfordParser
+
+
+class CombineTest(unittest.TestCase):
+    def test_follows_product_order(self):
+        combinations = StanfordCorrector.combine([[["a"], ["b"]], [["c"], ["d", "e"]]])
+        self.assertEqual(list(combinations), [["a", "c"], ["a", "d", "e"], ["b", "c"], ["b", "d", "e"]])
+
+    def test_drops_repeated_adjectives(self):
+        self.assertEqual(list(StanfordCorrector.combine([[["a"], ["a"]], [["b"]]])), [["a", "b"]])
+        combinations = StanfordCorrector.combine([[["a"], ["a", "b"]], [["b", "c"], ["c"]]])
+        self.assertEqual(list(combinations), [["a", "b", "c"], ["a", "c"], ["a", "b", "b", "c"]])
+
+    def test_limit_stops_expansion(self):
+        inp = [[["a{}".format(i)], ["b{}".format(i)]] for i in range(10)]
+        statistics = {"truncations": 0}
+        combinations = list(StanfordCorrector.combine(inp, 5, statistics))
+        self.assertEqual(combinations, list(StanfordCorrector.combine(inp))[:5])
+        self.assertEqual(statistics["truncations"], 1)
+
+    def test_limit_reached_exactly_is_not_truncation(self):
+        statistics = {"truncations": 0}
+        combinations = list(StanfordCorrector.combine([[["a"], ["b"]], [["c"], ["d"]]], 4, statistics))
+        self.assertEqual(len(combinations), 4)
+        self.assertEqual(statistics["truncations"], 0)
+
+    def test_corrector_counts_truncations(self):
+        string = "(S (VP (VB show) (NP (ADJP (JJ big) (CC or) (JJ old) (CC or) (JJ new)) " \
+                 "(ADJP (JJ public) (CC or) (JJ private)) (NNS repos))))"
+        tree = StanfordParser.convert(Tree.fromstring(string))
+        corrector = StanfordCorrector(limit=4)
+        root = corrector.correct(tree)
+        expected = StanfordCorrector().correct(tree).vps[0].nps
+        self.assertEqual([str(np) for np in root.vps[0].nps[:4]], [str(np) for np in expected[:4]])
+        self.assertEqual(len(root.vps[0].nps), len(expected) - 2)
+        self.assertEqual(corrector.statistics["truncations"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from itertools import permutations
+
+from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.types.Shell import Shell
+
+
+class DispatchTest(unittest.TestCase):
+    @staticmethod
+    def scan(shells: list, adjectives: list) -> Shell:
+        relevant = [shell for shell in shells if set(shell.adjectives) <= set(adjectives)]
+        if len(relevant) == 0: return None
+        return min(relevant, key=lambda shell: shell.distance(adjectives))
+
+    def check(self, builder: EvaluationBuilder):
+        adjectives = sorted({jj for shells in builder._builders.values() for shell in shells for jj in shell.adjectives})
+        adjectives = [jj for jj in adjectives if not jj.startswith("x")][:4] + ["x3", "big"]
+        queries = [list(query) for size in range(4) for query in permutations(adjectives, size)]
+        for noun, shells in builder._builders.items():
+            for query in queries:
+                self.assertIs(builder._get_relevant_shell(noun, query), DispatchTest.scan(shells, query), (noun, query))
+
+    def test_index_matches_scan(self):
+        self.check(EvaluationBuilder(lambda: None, lambda _type: None))
+
+    def test_index_matches_scan_on_large_table(self):
+        builder = EvaluationBuilder(lambda: None, lambda _type: None)
+        builder._builders = {noun: shells + [Shell(shell.adjectives + ["x{}".format(k)], shell.functions)
+                                             for k in range(1, 50) for shell in shells]
+                             for noun, shells in builder._builders.items()}
+        builder._index = EvaluationBuilder._compile(builder._builders)
+        self.check(builder)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from nltk import Tree
+
+from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.nlp.FastParser import FastParser
+from src.main.nlp.StanfordCorrector import StanfordCorrector
+from src.main.nlp.StanfordParser import StanfordParser
+
+
+class FastParserTest(unittest.TestCase):
+    parsed = {
+        "hello": "(S (VP (VB show) (NP (UH hello))))",
+        "hi": "(S (VP (VB show) (NP (UH hi))))",
+        "bye": "(S (VP (VB show) (NP (NN bye))))",
+        "log in": "(S (VP (VB log) (PRT (RP in))))",
+        "log out": "(S (VP (VB log) (PRT (RP out))))",
+        "sign in": "(S (VP (VB sign) (PRT (RP in))))",
+        "my repositories": "(S (VP (VB show) (NP (PRP$ my) (NNS repositories))))",
+        "show my gists": "(S (VP (VB show) (NP (PRP$ my) (NNS gists))))",
+        "saloed's gists": "(S (VP (VB show) (NP (NP (NN saloed) (POS 's)) (NNS gists))))",
+        "show developerhacker's repos": "(S (VP (VB show) (NP (NP (NN developerhacker) (POS 's)) (NNS repos))))"
+    }
+
+    unsupported = [
+        "show the avatar url and orgs url of saloed",
+        "store a user with the name aezakme",
+        "a repo gitbot of developerhacker",
+        "show hello world"
+    ]
+
+    def setUp(self):
+        self.parser = FastParser(EvaluationBuilder(lambda: None, lambda _type: None).nouns)
+
+    def test_matches_corrector(self):
+        for string, parsed in FastParserTest.parsed.items():
+            with self.subTest(string):
+                expected = StanfordCorrector().correct(StanfordParser.convert(Tree.fromstring(parsed)))
+                self.assertEqual(str(self.parser.parse(string)), str(expected))
+        self.assertEqual(self.parser.statistics["hits"], len(FastParserTest.parsed))
+
+    def test_unsupported_falls_through(self):
+        for i, string in enumerate(FastParserTest.unsupported):
+            with self.subTest(string):
+                self.assertIsNone(self.parser.parse(string))
+                self.assertEqual(self.parser.statistics["misses"], i + 1)
+        self.assertEqual(self.parser.statistics["hits"], 0)
+
+    def test_hit_rate_and_latency(self):
+        strings = list(FastParserTest.parsed) + FastParserTest.unsupported
+        for _ in range(100):
+            for string in strings: self.parser.parse(string)
+        total = self.parser.statistics["hits"] + self.parser.statistics["misses"]
+        self.assertEqual(self.parser.statistics["hits"] / total, len(FastParserTest.parsed) / len(strings))
+        self.assertLess(self.parser.statistics["time"] / total, 0.001)
+
+
+if __name__ == "__main__":
+    unittest.main()
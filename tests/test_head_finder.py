@@ -0,0 +1,59 @@
+import unittest
+
+from nltk import Tree
+from nltk.parse import DependencyGraph
+
+from src.main.nlp.StanfordCorrector import StanfordCorrector
+from src.main.nlp.StanfordParser import StanfordParser
+
+
+class RecordedCorrector(StanfordCorrector):
+    graphs = {
+        "a id": "a DT 2 det\nid NN 0 ROOT",
+        "first repo": "first JJ 2 amod\nrepo NN 0 ROOT",
+        "my avatar url": "my PRP$ 3 nmod:poss\navatar NN 3 compound\nurl NN 0 ROOT",
+        "my repositories": "my PRP$ 2 nmod:poss\nrepositories NNS 0 ROOT",
+        "my gists": "my PRP$ 2 nmod:poss\ngists NNS 0 ROOT",
+        "the avatar url": "the DT 3 det\navatar NN 3 compound\nurl NN 0 ROOT",
+        "orgs url": "orgs NNS 2 compound\nurl NN 0 ROOT",
+        "this user": "this DT 2 det\nuser NN 0 ROOT",
+        "a user": "a DT 2 det\nuser NN 0 ROOT",
+        "the name": "the DT 2 det\nname NN 0 ROOT",
+        "the name aezakme": "the DT 3 det\nname NN 3 compound\naezakme NN 0 ROOT",
+        "a developerhacker": "a DT 2 det\ndeveloperhacker NN 0 ROOT",
+        "repo 64680022": "repo NN 0 ROOT\n64680022 CD 1 nummod",
+        "user Saloed": "user NN 2 compound\nSaloed NNP 0 ROOT",
+        "a repo gitbot": "a DT 3 det\nrepo NN 3 compound\ngitbot NN 0 ROOT"
+    }
+
+    def _raw_parse_sents(self, strings: list) -> list:
+        return [DependencyGraph(RecordedCorrector.graphs[string]) for string in strings]
+
+
+class HeadFinderTest(unittest.TestCase):
+    transcript = [
+        "(S (VP (VB show) (NP (NP (DT a) (NN id)) (PP (IN at) (NP (NP (JJ first) (NN repo)) (PP (IN of) (NP (NP "
+        "(NN developerhacker) (POS 's)) (NNS repositories))))))))",
+        "(S (VP (VB show) (NP (NNS repositories)) (PP (IN at) (NP (NN developerhacker)))))",
+        "(S (VP (VB show) (NP (PRP$ my) (NN avatar) (NN url))))",
+        "(S (VP (VB store) (NP (DT a) (NN user)) (PP (IN with) (NP (DT the) (NN name) (NN aezakme)))))",
+        "(S (VP (VB show) (NP (NP (DT the) (NN name)) (PP (IN for) (NP (DT this) (NN user))))))",
+        "(S (VP (VB show) (NP (NP (PRP$ my) (NNS repositories)) (CC and) (NP (PRP$ my) (NNS gists)) (, ,) (NP (NP "
+        "(DT the) (NN avatar) (NN url) (CC and) (NNS orgs) (NN url)) (PP (IN of) (NP (NN saloed)))) (, ,) (CC and) "
+        "(NP (NP (DT this) (NN user) (POS 's)) (NN id)))))",
+        "(S (VP (VB show) (NP (NP (DT a) (NN developerhacker) (POS 's)) (NN repo) (CD 64680022))))",
+        "(S (VP (VB show) (NP (NP (DT the) (NN name)) (PP (IN at) (NP (NN user) (NNP Saloed))))))",
+        "(S (VP (VB show) (NP (NP (DT a) (NN repo) (NN gitbot)) (PP (IN of) (NP (NN developerhacker))))))"
+    ]
+
+    def test_heads_match_dependency_parser_on_readme(self):
+        for string in HeadFinderTest.transcript:
+            with self.subTest(string):
+                tree = StanfordParser.convert(Tree.fromstring(string))
+                expected = RecordedCorrector(heads=False).correct(tree)
+                actual = RecordedCorrector(heads=True).correct(tree)
+                self.assertEqual(str(actual), str(expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+
+from nltk import Tree
+
+from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.nlp.StanfordCorrector import StanfordCorrector
+from src.main.nlp.StanfordParser import StanfordParser
+from src.main.types.Object import Login
+from stubs import StubConnector
+
+
+class MarkTest(unittest.TestCase):
+    def test_marked_object_matches_original(self):
+        login = Login("saloed")
+        marked = login.mark("of")
+        self.assertEqual(marked.label(), "of")
+        self.assertIsNone(login.label())
+        self.assertEqual(marked, login)
+        self.assertEqual(hash(marked), hash(login))
+        self.assertEqual(str(marked), str(login))
+        self.assertIs(marked.type, login.type)
+        self.assertEqual(marked.mark("at").label(), "at")
+        self.assertEqual(marked.simplify(), login.simplify())
+
+    def test_arguments_resolve_through_marks(self):
+        builder = EvaluationBuilder(lambda: StubConnector(), lambda _type: None, workers=0)
+        for np, expected in (("(DT the) (NN name)", "Saloed"),
+                             ("(NN avatar) (NN url)", "https://avatars.githubusercontent.com/saloed")):
+            with self.subTest(np):
+                tree = StanfordParser.convert(Tree.fromstring(
+                    "(S (VP (VB show) (NP (NP {}) (PP (IN of) (NP (NN saloed))))))".format(np)))
+                closures = builder.build(StanfordCorrector().correct(tree))
+                self.assertEqual([str(arg.object) for arg in closures[0].args], [expected])
+        builder.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
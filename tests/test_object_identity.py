@@ -0,0 +1,67 @@
+import unittest
+
+from github import Github
+from github.Gist import Gist
+from github.NamedUser import NamedUser
+from github.PaginatedList import PaginatedList
+from github.Repository import Repository
+
+from src.main.nlp.Number import Number
+from src.main.types import Object, Types
+from src.main.types.Pages import Pages
+
+
+class OfflineRequester:
+    def __init__(self, requester):
+        self.requester = requester
+        self.requests = []
+
+    def request(self, verb, url, *args, **kwargs):
+        self.requests.append(url)
+        raise AssertionError("unexpected {} {}".format(verb, url))
+
+    def __enter__(self):
+        self.requester.requestJsonAndCheck = self.request
+        self.requester.requestJson = self.request
+        return self
+
+    def __exit__(self, *args):
+        del self.requester.requestJsonAndCheck
+        del self.requester.requestJson
+
+
+class ObjectIdentityTest(unittest.TestCase):
+    def setUp(self):
+        self.offline = OfflineRequester(Github()._Github__requester)
+        requester = self.offline.requester
+        api = "https://api.github.com"
+        self.users = [NamedUser(requester, {}, {"login": login, "url": "{}/users/{}".format(api, login)}, completed=False)
+                      for login in ("saloed", "developerhacker")]
+        self.repos = [Repository(requester, {}, {"id": i, "url": "{}/repos/x/repo{}".format(api, i)}, completed=False)
+                      for i in range(3)]
+        self.gists = [Gist(requester, {}, {"id": str(i), "url": "{}/gists/{}".format(api, i)}, completed=False)
+                      for i in range(2)]
+        self.pages = Pages(PaginatedList(Repository, requester, "{}/users/saloed/repos".format(api), None))
+
+    def objects(self) -> list:
+        return [Object.User(user) for user in self.users] + \
+               [Object.Repo(repo) for repo in self.repos] + \
+               [Object.Gist(gist) for gist in self.gists] + \
+               [Object.List(self.repos, Types.List(Types.Repo())), Object.List(self.pages, Types.List(Types.Repo())),
+                Object.Integer(Number("12".split()))]
+
+    def test_str_needs_the_network(self):
+        with self.offline:
+            self.assertRaises(AssertionError, str, Object.User(self.users[0]))
+        self.assertEqual(self.offline.requests, ["https://api.github.com/users/saloed"])
+
+    def test_hashing_makes_no_requests(self):
+        with self.offline:
+            unique = set(self.objects() + self.objects())
+            self.assertEqual(len(unique), len(self.objects()))
+            self.assertEqual({obj: obj for obj in self.objects()}[Object.Repo(self.repos[1])], Object.Repo(self.repos[1]))
+        self.assertEqual(self.offline.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
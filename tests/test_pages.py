@@ -0,0 +1,47 @@
+import unittest
+
+from nltk import Tree
+
+from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.nlp.StanfordCorrector import StanfordCorrector
+from src.main.nlp.StanfordParser import StanfordParser
+from src.main.types.Pages import Pages
+from stubs import StubConnector
+
+
+class PagesTest(unittest.TestCase):
+    def setUp(self):
+        self.connector = StubConnector()
+        self.repos = self.connector.user("developerhacker").get_repos()
+        del self.connector.requests[:]
+
+    def test_index_fetches_one_page(self):
+        for index, requests, name in ((0, 1, "repo0"), (250, 1, "repo250"), (-1, 2, "repo349")):
+            with self.subTest(index):
+                del self.connector.requests[:]
+                self.assertEqual(Pages(self.repos)[index].name, name)
+                self.assertEqual(len(self.connector.requests), requests)
+
+    def test_iteration_shares_indexed_pages(self):
+        pages = Pages(self.repos)
+        pages[0]
+        self.assertEqual(sum(1 for _ in pages), StubConnector.repos)
+        self.assertEqual(len(self.connector.requests), 4)
+
+    def test_ordinal_of_repositories_fetches_one_page(self):
+        builder = EvaluationBuilder(lambda: self.connector, lambda _type: None, workers=0)
+        for jj, name, requests in (("first", "repo0", 1), ("third", "repo2", 1)):
+            with self.subTest(jj):
+                del self.connector.requests[:]
+                tree = StanfordParser.convert(Tree.fromstring(
+                    "(S (VP (VB show) (NP (NP (DT the) (JJ {}) (NN repo)) (PP (IN of) (NP (NP (NN developerhacker) "
+                    "(POS 's)) (NNS repositories))))))".format(jj)))
+                closures = builder.build(StanfordCorrector().correct(tree))
+                self.assertEqual(closures[0].args[0].object.name, name)
+                repos = [url for url in self.connector.requests if url.endswith("/repos")]
+                self.assertEqual(len(repos), requests)
+        builder.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
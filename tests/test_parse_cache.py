@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from src.main.nlp.ParseCache import ParseCache
+from src.main.types.Node import LeafNounPhrase, Root, VerbPhrase
+
+
+def root(noun: str) -> Root:
+    return Root(vps=[VerbPhrase(nps=[LeafNounPhrase(noun)], vbs=["show"])])
+
+
+class ParseCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_metadata_names_are_plain_utterances(self):
+        cache = ParseCache(path=self.path)
+        for key in (ParseCache._stamp_key, ParseCache._model_key, ParseCache._format_key):
+            self.assertIsNone(cache.get(key))
+            cache.put(key, root(key))
+            cache.put("show repos", root("repos"))
+        cache.close()
+        cache = ParseCache(path=self.path)
+        self.assertEqual(str(cache.get(ParseCache._stamp_key)), str(root(ParseCache._stamp_key)))
+        self.assertEqual(str(cache.get("show  repos")), str(root("repos")))
+        self.assertEqual(cache.statistics["disk hits"], 2)
+        cache.close()
+
+    def test_disk_eviction_keeps_newest(self):
+        cache = ParseCache(size=1, path=self.path, disk_size=4)
+        for i in range(10): cache.put("show repo {}".format(i), root(str(i)))
+        self.assertGreater(cache.statistics["disk evictions"], 0)
+        self.assertIsNotNone(cache.get("show repo 9"))
+        self.assertIsNone(cache.get("show repo 0"))
+        cache.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
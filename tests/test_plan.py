@@ -0,0 +1,28 @@
+import unittest
+
+from nltk import Tree
+
+from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.nlp.StanfordCorrector import StanfordCorrector
+from src.main.nlp.StanfordParser import StanfordParser
+from stubs import StubConnector
+
+
+class PlanTest(unittest.TestCase):
+    sentence = "(S (VP (VB show) (NP (NP (NN avatar) (NN url) (CC and) (NNS orgs) (NN url)) (PP (IN of) (NP (NN saloed))))))"
+
+    def test_sentence_fetches_each_user_once(self):
+        for workers in (0, 4):
+            with self.subTest(workers=workers):
+                connector = StubConnector()
+                builder = EvaluationBuilder(lambda: connector, lambda _type: None, workers=workers)
+                tree = StanfordParser.convert(Tree.fromstring(PlanTest.sentence))
+                closures = builder.build(StanfordCorrector().correct(tree))
+                builder.close()
+                self.assertEqual([str(arg.object) for arg in closures[0].args],
+                                 ["https://avatars.githubusercontent.com/saloed", "https://api.github.com/users/saloed/orgs"])
+                self.assertEqual(len(connector.requests), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
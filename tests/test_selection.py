@@ -0,0 +1,74 @@
+import unittest
+
+from stubs import StubConnector
+from src.main.nlp.EvaluationBuilder import EvaluationBuilder
+from src.main.types import Types
+from src.main.types.Function import Function
+from src.main.types.Object import Object, Login, User, List, String
+from src.main.types.Pages import Pages
+from src.main.types.Shell import Shell
+
+
+class SelectionTest(unittest.TestCase):
+    def setUp(self):
+        self.builder = EvaluationBuilder(lambda: None, lambda _type: None)
+
+    def select(self, noun: str, arguments: list, adjectives=(), prune=True):
+        self.builder._prune = prune
+        shell = self.builder._get_relevant_shell(noun, list(adjectives))
+        return self.builder._get_relevant_function(noun, shell.difference(list(adjectives)), shell, arguments)
+
+    def test_binds_every_argument_before_comparing_cost(self):
+        for noun, result in (("repo", Types.Repo()), ("gist", Types.Gist())):
+            function = self.select(noun, [Object.valueOf("gitbot"), Login("hackermadcat")])
+            self.assertEqual(function.args, (Types.Login(), Types.String()))
+            self.assertIs(function.result, result)
+
+    def test_pruning_keeps_exhaustive_choice(self):
+        arguments = [[], [Object.valueOf("12")], [Object.valueOf("gitbot"), Login("hackermadcat")],
+                     [Login("hackermadcat"), Object.valueOf("3")]]
+        for noun in sorted(self.builder.nouns):
+            for args in arguments:
+                exhaustive = self.select(noun, args, prune=False)
+                pruned = self.select(noun, args)
+                self.assertEqual(pruned.score, exhaustive.score)
+                if pruned.mass < float("inf"): self.assertIs(pruned.body, exhaustive.body)
+
+    def test_costs_count_requests(self):
+        for noun in ("repos", "gists"):
+            for index in range(3):
+                connector = StubConnector()
+                builder = EvaluationBuilder(lambda: connector, lambda _type: None)
+                function = builder._index[noun][0][frozenset()][1].functions[index]
+                arguments = {Types.String(): Object.valueOf("octocat"), Types.Login(): Login("octocat"),
+                             Types.User(): User(connector.user("octocat"))}
+                connector.requests.clear()
+                EvaluationBuilder._execute(function, [arguments[hole] for hole in function.args])
+                self.assertEqual(len(connector.requests), function.cost)
+        for function in self.builder._index["repo"][0][frozenset()][1].functions[-2:]:
+            connector = StubConnector()
+            repos = List(Pages(connector.user("octocat").get_repos()), Types.List(Types.Repo()))
+            connector.requests.clear()
+            ordinal = String("third") if function.args[1] == Types.String() else Object.valueOf("3")
+            EvaluationBuilder._execute(function, [repos, ordinal])
+            self.assertEqual(len(connector.requests), function.cost)
+
+    def test_prefers_fewer_requests_between_equal_parses(self):
+        connector = StubConnector()
+        pages = -(-StubConnector.repos // Pages.per_page)
+        eager = Function([Types.Login()], Types.List(Types.Repo()),
+                         lambda login: [repo for repo in Pages(connector.user(login).get_repos())], cost=1 + pages)
+        lazy = Function([Types.Login()], Types.List(Types.Repo()),
+                        lambda login: Pages(connector.user(login).get_repos()), cost=1)
+        self.builder._index = EvaluationBuilder._compile({"repos": [Shell([], [eager, lazy])]})
+        for prune in (True, False):
+            function = self.select("repos", [Login("octocat")], prune=prune)
+            self.assertIs(function.body, lazy.body)
+        for function in (eager, lazy):
+            connector.requests.clear()
+            function.run("octocat")
+            self.assertEqual(len(connector.requests), function.cost)
+
+
+if __name__ == "__main__":
+    unittest.main()
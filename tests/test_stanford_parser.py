@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+
+from nltk import Tree
+
+from src.main.interfaces.Parser import Node
+from src.main.nlp.StanfordParser import StanfordParser
+
+
+class StubParser(StanfordParser):
+    trees = {
+        "hello": "(ROOT (NP (UH hello)))",
+        "show hello": "(ROOT (S (VP (VB show) (NP (UH hello)))))",
+        "hello , show my repos": "(ROOT (S (INTJ (UH hello)) (, ,) (VP (VB show) (NP (PRP$ my) (NNS repos)))))",
+        "show hello , show my repos": "(ROOT (S (VP (VB show) (NP (UH hello))) (, ,) (VP (VB show) (NP (PRP$ my) (NNS repos)))))"
+    }
+
+    def __init__(self, shapes=256):
+        super().__init__(shapes=shapes)
+        self.parsed = []
+
+    def _raw_parse(self, string: str) -> Tree:
+        self.parsed.append(string)
+        return Tree.fromstring(StubParser.trees[string])[0]
+
+
+class GraphNode(Node):
+    __slots__ = ()
+
+    @staticmethod
+    def convert(tree: Tree) -> 'GraphNode':
+        root = GraphNode(tree.label())
+        for child in tree: root.append(child if isinstance(child, str) else GraphNode.convert(child))
+        return root
+
+    def _pformat_flat(self, node_separator, brackets, first):
+        if self.isleaf():
+            child_strings = [str(child) for child in self.children()]
+        else:
+            child_strings = [child._pformat_flat(node_separator, brackets, False) for child in self.children()]
+        if first: return '{}{} {}'.format(self._label, node_separator, ' '.join(child_strings))
+        return '{}{}{} {}{}'.format(brackets[0], self._label, node_separator, ' '.join(child_strings), brackets[1])
+
+    def pformat(self, margin=80, indent=0, node_separator='', brackets="()"):
+        string = self._pformat_flat(node_separator, brackets, True)
+        if len(string) + indent < margin: return string
+        string = "{}{}".format(self._label, node_separator)
+        for i, child in enumerate(self.children()):
+            edge = '├─ ' if i < len(self.children()) - 1 else '└─ '
+            string += '\n' + ' ' * indent + edge + child.pformat(margin, indent + 3, node_separator, brackets)
+        return string + brackets[1]
+
+    def __str__(self) -> str:
+        return self.pformat()
+
+    def isleaf(self) -> bool:
+        return any(isinstance(child, str) for child in self.children())
+
+    def flatten(self) -> list:
+        return [word for child in self.children() for word in ([child] if isinstance(child, str) else child.flatten())]
+
+    def leaves(self) -> list:
+        return [self] if self.isleaf() else [leaf for child in self.children() for leaf in child.leaves()]
+
+
+class StanfordTreeTest(unittest.TestCase):
+    parsed = "(ROOT (S (VP (VB show) (NP (NP (PRP$ my) (NNS repositories)) (CC and) (NP (PRP$ my) (NNS gists)) (, ,) " \
+             "(NP (NP (DT the) (NN avatar) (NN url) (CC and) (NNS orgs) (NN url)) (PP (IN of) (NP (NN saloed)))) " \
+             "(, ,) (CC and) (NP (NP (DT this) (NN user) (POS 's)) (NN id))))))"
+
+    @staticmethod
+    def key(node) -> tuple:
+        return node if isinstance(node, str) else (node.label, tuple(node.flatten()))
+
+    def compare(self, node, expected, labels: list, phrases: list):
+        keys = lambda nodes: [StanfordTreeTest.key(child) for child in nodes]
+        self.assertEqual(node.label, expected.label)
+        self.assertEqual(node.isleaf(), expected.isleaf())
+        self.assertEqual(node.flatten(), expected.flatten())
+        self.assertEqual(keys(node.leaves()), keys(expected.leaves()))
+        self.assertEqual(keys(node), keys(expected))
+        self.assertEqual(keys(node.children()), keys(expected.children()))
+        self.assertEqual(keys(node.sub_children()), keys(expected.sub_children()))
+        self.assertEqual(str(node), str(expected))
+        for i, child in enumerate(expected.children()):
+            self.assertEqual(StanfordTreeTest.key(node[i]), StanfordTreeTest.key(child))
+        if expected.isleaf(): return
+        for label in labels:
+            self.assertEqual(keys(node.children(label=label)), keys(expected.children(label=label)))
+        for label in phrases:
+            self.assertEqual(keys(node.sub_children(label=label)), keys(expected.sub_children(label=label)))
+        self.assertEqual(keys(node.sub_children(labels=phrases)), keys(expected.sub_children(labels=phrases)))
+        for child, expected_child in zip(node.children(), expected.children()):
+            self.compare(child, expected_child, labels, phrases)
+
+    def test_flat_tree_matches_node_graph(self):
+        tree = Tree.fromstring(StanfordTreeTest.parsed)[0]
+        labels = sorted({subtree.label() for subtree in tree.subtrees()})
+        phrases = sorted({subtree.label() for subtree in tree.subtrees() if subtree.height() > 2})
+        self.compare(StanfordParser.convert(tree), GraphNode.convert(tree), labels, phrases)
+
+    def test_flat_tree_is_read_only(self):
+        node = StanfordParser.convert(Tree.fromstring(StanfordTreeTest.parsed)[0])
+        self.assertRaises(Exception, node.append, node)
+        self.assertRaises(Exception, node.remove, label="VP")
+
+
+
+class StanfordParserTest(unittest.TestCase):
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def test_prediction_never_changes_the_parse(self):
+        parser = StubParser()
+        for _ in range(3): parser.parse("hello")
+        self.assertEqual(parser.statistics["reparses"], 1)
+        root = parser.parse("hello , show my repos")
+        parser.close()
+        self.assertEqual(root.label, "S")
+        self.assertEqual(str(root.flatten()), str(parser.convert(Tree.fromstring(StubParser.trees["hello , show my repos"])[0]).flatten()))
+        self.assertEqual(parser.statistics["predicted"], 3)
+        self.assertEqual(parser.statistics["mispredicted"], 1)
+
+    def test_shapes_are_bounded(self):
+        parser = StubParser(shapes=1)
+        parser._raw_parse = lambda string: Tree.fromstring(StubParser.trees["hello"])[0]
+        for _ in range(2): parser.parse("hello")
+        parser.parse("bye")
+        self.assertEqual(list(parser._shapes), ["bye"])
+        self.assertEqual(parser.statistics["shape evictions"], 1)
+        parser.parse("hello")
+        parser.close()
+        self.assertEqual(parser.statistics["predicted"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from unittest import mock
+
+from nltk.parse.corenlp import CoreNLPServerError
+
+from src.main.nlp.StanfordServer import StanfordServer
+
+
+class FailingServer:
+    started = []
+
+    def __init__(self, port=None, corenlp_options=None):
+        self.url = "http://localhost:{}".format(port or 9000)
+        self.popen = None
+        self.stopped = False
+        FailingServer.started.append(self)
+
+    def start(self):
+        self.popen = mock.Mock()
+        raise CoreNLPServerError("The server is not ready.")
+
+    def stop(self):
+        self.stopped = True
+        raise OSError("stop failed")
+
+
+class StanfordServerTest(unittest.TestCase):
+    def test_failed_start_stops_the_process(self):
+        del FailingServer.started[:]
+        server = StanfordServer()
+        with mock.patch("nltk.parse.corenlp.CoreNLPServer", FailingServer):
+            with self.assertRaises(StanfordServer.DeadServerException) as raised:
+                server.start()
+        self.assertIsInstance(raised.exception.__cause__, CoreNLPServerError)
+        self.assertEqual([started.stopped for started in FailingServer.started], [True])
+        self.assertRaises(StanfordServer.DeadServerException, server.start)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+
+from src.main.types.Types import Any, List, Repo, String, Type
+
+
+class SlowGeneric:
+    blocks = ("slow",)
+
+    def __hash__(self):
+        time.sleep(0.001)
+        return 0
+
+
+class TypesTest(unittest.TestCase):
+    def test_list_interning_is_thread_safe(self):
+        generic = SlowGeneric()
+        barrier = Barrier(8)
+
+        def create(_):
+            barrier.wait()
+            return List(generic)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            instances = list(pool.map(create, range(8)))
+        self.assertTrue(all(instance is instances[0] for instance in instances))
+        self.assertIs(instances[0].generic, generic)
+        self.assertEqual(instances[0].blocks, ("list", "slow"))
+
+    def test_types_are_canonical(self):
+        self.assertIs(List(), List(Any()))
+        self.assertIs(Type.valueOf(["list", "repo"]), List(Repo()))
+        self.assertIs(Type.valueOf(["string"]), String())
+
+
+if __name__ == "__main__":
+    unittest.main()